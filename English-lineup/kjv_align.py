@@ -1,69 +1,147 @@
+from array import array
+from functools import lru_cache
+from operator import itemgetter
 from tf.fabric import Fabric
 import json
+import mmap
+import os
+import re
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 BHSA_DIR = './bhsa/tf/2021'
 OHB_CSV_FILE = 'BHSA-with-interlinear-translation.csv'
 OFFSET_MAP_FILE = 'bhsa_ohb_offsets.json'
 
+_NEWLINE_RE = re.compile(b'\n')
+
+# Well-formed BSB field: 〔sort＠english〕
+_BSB_RE = re.compile('\u3014(\\d+)\uff20([^\uff20]*)\u3015')
+
+def _parse_bsb_field(bsb_field):
+    """Split a BSB field of the form 〔1＠In〕 into (english, bsb_sort)"""
+    m = _BSB_RE.fullmatch(bsb_field)
+    if m:
+        return m.group(2), int(m.group(1))
+    
+    # Irregular field: fall back to lenient slicing
+    english_text = ''
+    bsb_sort = None
+    if bsb_field:
+        # The field uses special brackets 〔〕 and full-width @ (＠)
+        # Strip the brackets
+        inner = bsb_field[1:-1] if len(bsb_field) > 2 else bsb_field
+        # Split on full-width @
+        if '\uff20' in inner:  # Unicode for ＠
+            split_parts = inner.split('\uff20')
+            if len(split_parts) == 2:
+                try:
+                    bsb_sort = int(split_parts[0])
+                except ValueError:
+                    pass
+                english_text = split_parts[1]
+    return english_text, bsb_sort
+
 class KJV_Align:
-    def __init__(self):
-        # Load BHSA for fallback glosses
-        TF = Fabric(locations=BHSA_DIR)
-        self.api = TF.load('gloss')
+    def __init__(self, api=None):
+        # Load BHSA for fallback glosses, unless the caller already has it loaded
+        if api is None:
+            TF = Fabric(locations=BHSA_DIR)
+            api = TF.load('gloss')
+        self.api = api
         
-        # Load OpenHebrewBible CSV
-        with open(OHB_CSV_FILE, 'r', encoding='utf-8') as f:
-            self.ohb_lines = f.readlines()
+        # Map the OpenHebrewBible CSV; rows are decoded only when looked up
+        self._open_ohb_csv(OHB_CSV_FILE)
         
         # Load offset map
-        with open(OFFSET_MAP_FILE, 'r') as f:
-            offset_data = json.load(f)
-            self.offset_map = {int(k): v for k, v in offset_data.items()}
+        if ORJSON_AVAILABLE:
+            with open(OFFSET_MAP_FILE, 'rb') as f:
+                offset_data = orjson.loads(f.read())
+        else:
+            with open(OFFSET_MAP_FILE, 'r') as f:
+                offset_data = json.load(f)
+        self.offset_map = {int(k): v for k, v in offset_data.items()}
+        
+        # Expand the offset boundaries into a per-node lookup table, and
+        # fold the offsets in to get the CSV row of every node directly
+        self._offset_lut = self._build_offset_lut(self.offset_map)
+        self._node_to_csv = array(
+            'q', (node + offset for node, offset in enumerate(self._offset_lut))
+        )
+        
+        # Per-instance cache of parsed rows; the same nodes recur across queries
+        self._ohb_cache = lru_cache(maxsize=200_000)(self._get_ohb_data_impl)
+    
+    def _open_ohb_csv(self, csv_file):
+        """Memory-map the OpenHebrewBible CSV and index where each line starts"""
+        with open(csv_file, 'rb') as f:
+            # An empty file cannot be mapped; it simply has no lines
+            if os.fstat(f.fileno()).st_size == 0:
+                self._ohb_mm = b''
+            else:
+                self._ohb_mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        mm = self._ohb_mm
+        line_starts = array('q', [0])
+        line_starts.extend(m.end() for m in _NEWLINE_RE.finditer(mm))
+        if line_starts[-1] != len(mm):
+            # Last line has no trailing newline: add an end sentinel
+            line_starts.append(len(mm))
+        self._line_starts = line_starts
+        self._n_rows = len(line_starts) - 1
+    
+    def _get_ohb_line(self, csv_idx):
+        """Decode a single line of the CSV"""
+        start = self._line_starts[csv_idx]
+        end = self._line_starts[csv_idx + 1]
+        return self._ohb_mm[start:end].decode('utf-8')
+    
+    @staticmethod
+    def _build_offset_lut(offset_map):
+        """Build a table holding the applicable offset for every node up to the last boundary"""
+        keys = sorted(offset_map)
+        lut = array('i', bytes(array('i').itemsize * ((keys[-1] + 1) if keys else 1)))
+        for k, next_k in zip(keys, keys[1:] + [len(lut)]):
+            lut[k:next_k] = array('i', [offset_map[k]]) * (next_k - k)
+        return lut
     
     def _get_offset(self, bhsa_node):
         """Get the offset for a given BHSA node"""
-        offset = 0
-        for node in sorted(self.offset_map.keys()):
-            if bhsa_node >= node:
-                offset = self.offset_map[node]
-            else:
-                break
-        return offset
+        lut = self._offset_lut
+        if bhsa_node < 0:
+            return 0
+        # Nodes past the last boundary keep its offset
+        return lut[bhsa_node] if bhsa_node < len(lut) else lut[-1]
+    
+    def _get_csv_idx(self, bhsa_node):
+        """Get the CSV row for a given BHSA node"""
+        if 0 <= bhsa_node < len(self._node_to_csv):
+            return self._node_to_csv[bhsa_node]
+        return bhsa_node + self._get_offset(bhsa_node)
     
     def _get_ohb_data(self, bhsa_node):
-        """Get OpenHebrewBible data for a BHSA node"""
-        offset = self._get_offset(bhsa_node)
-        csv_idx = bhsa_node + offset
+        """Get OpenHebrewBible data for a BHSA node (cached, do not mutate)"""
+        return self._ohb_cache(bhsa_node)
+    
+    def _get_ohb_data_impl(self, bhsa_node):
+        """Parse the OpenHebrewBible row for a BHSA node"""
+        csv_idx = self._get_csv_idx(bhsa_node)
         
-        if csv_idx < 1 or csv_idx >= len(self.ohb_lines):
+        if csv_idx < 1 or csv_idx >= self._n_rows:
             return None
         
-        parts = self.ohb_lines[csv_idx].strip().split('\t')
+        parts = self._get_ohb_line(csv_idx).strip().split('\t')
         if len(parts) < 3:
             return None
         
-        gloss = parts[2] if len(parts) > 2 else ''
-        bsb_field = parts[3] if len(parts) > 3 else ''
-        
-        # Parse BSB field: format is 〔1＠In〕
-        english_text = ''
-        bsb_sort = None
-        if bsb_field:
-            # The field uses special brackets 〔〕 and full-width @ (＠)
-            # Strip the brackets
-            inner = bsb_field[1:-1] if len(bsb_field) > 2 else bsb_field
-            # Split on full-width @
-            if '\uff20' in inner:  # Unicode for ＠
-                split_parts = inner.split('\uff20')
-                if len(split_parts) == 2:
-                    try:
-                        bsb_sort = int(split_parts[0])
-                    except ValueError:
-                        pass
-                    english_text = split_parts[1]
+        english_text, bsb_sort = _parse_bsb_field(parts[3] if len(parts) > 3 else '')
         
         return {
-            'gloss': gloss,
+            'gloss': parts[2],
             'english': english_text,
             'bsb_sort': bsb_sort
         }
@@ -80,15 +158,13 @@ class KJV_Align:
             # Try to get BSB translation from OHB
             ohb_data = self._get_ohb_data(node)
             if ohb_data and ohb_data['english']:
-                text = ohb_data['english']
-                bsb_sort = ohb_data['bsb_sort']
-                
                 # Use BSB sort order if available, otherwise use node order
+                bsb_sort = ohb_data['bsb_sort']
                 sort_key = bsb_sort if bsb_sort is not None else node
-                words_with_sort.append((sort_key, text))
+                words_with_sort.append((sort_key, ohb_data['english']))
         
         # Sort by the sort key (BSB order)
-        words_with_sort.sort(key=lambda x: x[0])
+        words_with_sort.sort(key=itemgetter(0))
         
         # Return just the text in sorted order
         return ' '.join([text for _, text in words_with_sort])
@@ -1,15 +1,33 @@
 #!/usr/bin/env python3
+import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from tf.fabric import Fabric
 from kjv_align import KJV_Align
 from termcolor import cprint
 
 # Configuration
 BHSA_DIR = './bhsa/tf/2021'
+ALIGN_WORKERS = 4   # threads formatting/aligning results
+ALIGN_BATCH = 64    # results pulled from the search per round (backpressure)
 
-def query_bible():
+def align_result(api, kjv_align, result):
+    """Get the BHSA text and aligned English text for one search result."""
+    # Get the book, chapter, and verse for the result
+    book, chapter, verse = api.T.sectionFromNode(result[0])
+    
+    # Get the BHSA text and the aligned English text for the word nodes
+    bhsa_text = api.T.text(result)
+    aligned_text = kjv_align.get_aligned_text(book, chapter, verse, result)
+    return bhsa_text, aligned_text
+
+def query_bible(limit=None):
     """
     A simple CLI to query the Bible and see aligned English text from OpenHebrewBible.
+    
+    Results are printed as the search yields them; if limit is given, at most
+    that many results are shown per query.
     """
     
     print("Loading data...")
@@ -19,9 +37,9 @@ def query_bible():
         print(f"Error: The BHSA data directory was not found at {BHSA_DIR}")
         return
     
-    # Load the BHSA data
+    # Load the BHSA data once, including the features KJV_Align needs
     TF = Fabric(locations=BHSA_DIR)
-    api = TF.load('book chapter verse')
+    api = TF.load('book chapter verse gloss')
     
     if not api or not hasattr(api.F, 'otype'):
         print("Failed to load BHSA data")
@@ -29,8 +47,11 @@ def query_bible():
         
     print("\n✓ Data loaded successfully!")
     
-    # Load the alignment module
-    kjv_align = KJV_Align()
+    # Load the alignment module, sharing the already loaded API
+    kjv_align = KJV_Align(api=api)
+    
+    # Results are aligned on a small thread pool, batch by batch
+    executor = ThreadPoolExecutor(max_workers=ALIGN_WORKERS)
     
     # Start the query loop
     while True:
@@ -44,33 +65,46 @@ def query_bible():
             query = '\n'.join(query.split(';'))
             
             try:
-                results = list(api.S.search(query))
+                results = api.S.search(query)
             except Exception as e:
                 print(f"Invalid query: {e}")
                 continue
             
-            if not results:
-                print("No results found.")
-                continue
-                
-            for result in results:
-                # Get the book, chapter, and verse for the result
-                book, chapter, verse = api.T.sectionFromNode(result[0])
-                
-                # Get the word nodes for the result
-                word_nodes = result
-                
-                # Get the BHSA text
-                bhsa_text = api.T.text(result)
-                
-                # Get the aligned English text
-                aligned_text = kjv_align.get_aligned_text(book, chapter, verse, word_nodes)
+            if limit is not None:
+                results = islice(results, limit)
+            
+            # Stream the results in bounded batches instead of materializing
+            # them all first; map() keeps each batch in result order
+            results = iter(results)
+            found = False
+            while True:
+                batch = list(islice(results, ALIGN_BATCH))
+                if not batch:
+                    break
+                found = True
                 
-                print(f"\nBHSA: {bhsa_text}")
-                print(f"English: {aligned_text}")
+                aligned = executor.map(
+                    lambda result: align_result(api, kjv_align, result), batch
+                )
+                for bhsa_text, aligned_text in aligned:
+                    print(f"\nBHSA: {bhsa_text}")
+                    print(f"English: {aligned_text}")
+            
+            if not found:
+                print("No results found.")
                 
         except Exception as e:
             print(f"An error occurred during the query: {e}")
+    
+    executor.shutdown()
 
 if __name__ == '__main__':
-    query_bible()
\ No newline at end of file
+    parser = argparse.ArgumentParser(
+        description='Query the Bible and see aligned English text from OpenHebrewBible.'
+    )
+    parser.add_argument(
+        '--limit', type=int, default=None,
+        help='show at most this many results per query'
+    )
+    args = parser.parse_args()
+    query_bible(limit=args.limit)
\ No newline at end of file
@@ -5,7 +5,16 @@ This file contains manual corrections for common particles and words
 that didn't match well with fuzzy matching.
 """
 
+from types import MappingProxyType
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Manual corrections for common Hebrew particles and prepositions
+# (read-only: wrapped in a MappingProxyType below)
 MANUAL_CORRECTIONS = {
     # Prepositions
     'בְּ': 'H9003',      # bet prefix - in, with, by
@@ -59,29 +68,39 @@ MANUAL_CORRECTIONS = {
     'רֹאשׁ': 'H7218',    # rosh - head
     'רֶגֶל': 'H7272',    # regel - foot
 }
+MANUAL_CORRECTIONS = MappingProxyType(MANUAL_CORRECTIONS)
 
 def apply_manual_corrections():
     """Apply manual corrections to the BHSA to Strong's mapping."""
     import json
+    from collections import Counter
     
     # Load the complete mapping
-    with open('bhsa_to_strongs_complete.json', 'r', encoding='utf-8') as f:
-        mapping = json.load(f)
+    if ORJSON_AVAILABLE:
+        with open('bhsa_to_strongs_complete.json', 'rb') as f:
+            mapping = orjson.loads(f.read())
+    else:
+        with open('bhsa_to_strongs_complete.json', 'r', encoding='utf-8') as f:
+            mapping = json.load(f)
     
     # Load Strong's data for reference
-    with open('strongs_to_bhsa.json', 'r', encoding='utf-8') as f:
-        strongs_data = json.load(f)
+    if ORJSON_AVAILABLE:
+        with open('strongs_to_bhsa.json', 'rb') as f:
+            strongs_data = orjson.loads(f.read())
+    else:
+        with open('strongs_to_bhsa.json', 'r', encoding='utf-8') as f:
+            strongs_data = json.load(f)
     
     corrections_made = 0
+    mapping_get = mapping.get
+    strongs_get = strongs_data.get
     
     for bhsa_word, correct_strongs in MANUAL_CORRECTIONS.items():
-        if bhsa_word in mapping:
-            old_match = mapping[bhsa_word]
-            
+        old_match = mapping_get(bhsa_word)
+        if old_match is not None:
             # Get Strong's data
-            if correct_strongs in strongs_data:
-                strongs_entry = strongs_data[correct_strongs]
-                
+            strongs_entry = strongs_get(correct_strongs)
+            if strongs_entry is not None:
                 # Update mapping
                 mapping[bhsa_word] = {
                     'strongs': correct_strongs,
@@ -96,18 +115,34 @@ def apply_manual_corrections():
                 print(f"✓ Corrected {bhsa_word}: {old_match['strongs']} → {correct_strongs}")
     
     # Save corrected mapping
-    with open('bhsa_to_strongs_complete.json', 'w', encoding='utf-8') as f:
-        json.dump(mapping, f, ensure_ascii=False, indent=2)
+    if ORJSON_AVAILABLE:
+        with open('bhsa_to_strongs_complete.json', 'wb') as f:
+            f.write(orjson.dumps(mapping, option=orjson.OPT_INDENT_2))
+    else:
+        with open('bhsa_to_strongs_complete.json', 'w', encoding='utf-8') as f:
+            json.dump(mapping, f, ensure_ascii=False, indent=2)
     
     print(f"\n✓ Applied {corrections_made} manual corrections")
     
-    # Update statistics
-    exact = sum(1 for v in mapping.values() if v['method'] in ['exact_match', 'manual_correction'])
-    consonantal = sum(1 for v in mapping.values() if v['method'] == 'consonantal_match')
-    fuzzy = sum(1 for v in mapping.values() if v['method'] == 'fuzzy_match')
-    high_conf = sum(1 for v in mapping.values() if v['score'] >= 0.9)
-    medium_conf = sum(1 for v in mapping.values() if 0.7 <= v['score'] < 0.9)
-    low_conf = sum(1 for v in mapping.values() if v['score'] < 0.7)
+    # Update statistics in a single pass over the mapping
+    by_method = Counter()
+    by_confidence = Counter()
+    for v in mapping.values():
+        by_method[v['method']] += 1
+        score = v['score']
+        if score >= 0.9:
+            by_confidence['high'] += 1
+        elif score >= 0.7:
+            by_confidence['medium'] += 1
+        else:
+            by_confidence['low'] += 1
+    
+    exact = by_method['exact_match'] + by_method['manual_correction']
+    consonantal = by_method['consonantal_match']
+    fuzzy = by_method['fuzzy_match']
+    high_conf = by_confidence['high']
+    medium_conf = by_confidence['medium']
+    low_conf = by_confidence['low']
     
     summary = {
         'total_bhsa_lexemes': len(mapping),
@@ -6,79 +6,129 @@ This is a simplified loader for the mapping task.
 """
 
 import os
-from typing import Dict, List, Tuple
+import pickle
+import sys
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple, Union
+
+# Read buffer for streaming .tf files (1 MiB)
+READ_BUFFER = 1 << 20
+
+# Parsed-data sidecar written next to the .tf files
+CACHE_FILE = '.simple_bhsa_loader.pkl'
+CACHE_SOURCES = ('otype.tf', 'lex_utf8.tf', 'voc_lex_utf8.tf', 'language.tf')
+# Bump when the layout of the cached data changes; older caches are reparsed
+CACHE_VERSION = 2
+CACHE_KEYS = ('lex_nodes', 'max_node', 'lex_utf8', 'voc_lex_utf8', 'language')
+
+
+def count_values(column: List[Optional[str]]) -> int:
+    """Count the nodes that have a value in a dense feature column."""
+    return len(column) - column.count(None)
+
+
+def grow_column(column: List[Optional[str]], node: int) -> None:
+    """Pad a dense feature column with None so that it can hold node."""
+    if node >= len(column):
+        column.extend(repeat(None, node + 1 - len(column)))
 
 
 class SimpleBHSALoader:
     """Simple loader for BHSA .tf files."""
     
-    def __init__(self, bhsa_path: str):
+    def __init__(self, bhsa_path: str, use_cache: bool = True):
         """
         Initialize loader.
         
         Args:
             bhsa_path: Path to BHSA tf directory
+            use_cache: Reuse/write a pickled sidecar of the parsed .tf data
         """
         self.bhsa_path = bhsa_path
+        self.use_cache = use_cache
         self.lex_nodes = []
-        self.lex_utf8 = {}
-        self.voc_lex_utf8 = {}
-        self.language = {}
+        self.max_node = 0
+        # Feature columns, indexed directly by node (None = no value)
+        self.lex_utf8 = []
+        self.voc_lex_utf8 = []
+        self.language = []
     
-    def load_tf_file(self, filename: str) -> Dict[int, str]:
+    def load_tf_file(
+        self, filename: str, size: Optional[int] = None
+    ) -> Union[Dict[int, str], List[Optional[str]]]:
         """
         Load a simple .tf file.
         
         Args:
             filename: Name of .tf file
+            size: If given, return a dense list indexed by node (nodes
+                0..size, None where there is no value) instead of a dict
             
         Returns:
-            Dictionary mapping node numbers to values
+            Dictionary (or dense list) mapping node numbers to values
         """
         filepath = os.path.join(self.bhsa_path, filename)
-        data = {}
+        data = {} if size is None else [None] * (size + 1)
         
         if not os.path.exists(filepath):
             print(f"  Warning: {filename} not found")
             return data
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Skip header lines (start with @)
-            content_start = 0
-            for i, line in enumerate(lines):
-                if not line.startswith('@'):
-                    content_start = i
-                    break
-            
-            # Parse data lines
-            current_node = None
-            for line in lines[content_start:]:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Node range or single node
-                if '\t' in line:
-                    parts = line.split('\t')
-                    if len(parts) == 2:
-                        node_spec, value = parts
+            with open(filepath, 'r', encoding='utf-8', buffering=READ_BUFFER) as f:
+                # Parse data lines in one streaming pass, skipping the
+                # header lines (start with @) at the top
+                intern = sys.intern
+                in_header = True
+                current_node = None
+                # Continuation lines are collected here and joined once
+                current_parts = None
+                for line in f:
+                    if in_header:
+                        if line.startswith('@'):
+                            continue
+                        in_header = False
+                    
+                    line = line.strip()
+                    if not line:
+                        continue
+                    
+                    # Node range or single node
+                    if '\t' in line:
+                        if current_parts is not None:
+                            data[current_node] = '\n'.join(current_parts)
+                            current_parts = None
                         
-                        # Handle node ranges (e.g., "1-100")
-                        if '-' in node_spec:
-                            start, end = map(int, node_spec.split('-'))
-                            for node in range(start, end + 1):
+                        parts = line.split('\t')
+                        if len(parts) == 2:
+                            node_spec, value = parts
+                            # Share one str object per distinct value
+                            value = intern(value)
+                            
+                            # Handle node ranges (e.g., "1-100")
+                            if '-' in node_spec:
+                                start, end = map(int, node_spec.split('-'))
+                                # Expand the whole range in one C-level update
+                                if size is None:
+                                    data.update(zip(range(start, end + 1), repeat(value)))
+                                else:
+                                    grow_column(data, end)
+                                    data[start:end + 1] = repeat(value, end - start + 1)
+                            else:
+                                # Single node
+                                node = int(node_spec)
+                                if size is not None:
+                                    grow_column(data, node)
                                 data[node] = value
-                        else:
-                            # Single node
-                            node = int(node_spec)
-                            data[node] = value
-                            current_node = node
-                elif current_node is not None:
-                    # Continuation of previous value
-                    data[current_node] += '\n' + line
+                                current_node = node
+                    elif current_node is not None:
+                        # Continuation of previous value
+                        if current_parts is None:
+                            current_parts = [data[current_node]]
+                        current_parts.append(line)
+                
+                if current_parts is not None:
+                    data[current_node] = '\n'.join(current_parts)
         
         except Exception as e:
             print(f"  Error loading {filename}: {e}")
@@ -89,6 +139,8 @@ class SimpleBHSALoader:
         """
         Load otype.tf to get lexeme nodes.
         
+        Also records the highest node seen in self.max_node.
+        
         Returns:
             Dictionary mapping types to node lists
         """
@@ -96,74 +148,152 @@ class SimpleBHSALoader:
         otypes = {}
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Skip header
-            content_start = 0
-            for i, line in enumerate(lines):
-                if not line.startswith('@'):
-                    content_start = i
-                    break
-            
-            # Parse otype data
-            for line in lines[content_start:]:
-                line = line.strip()
-                if not line or not '\t' in line:
-                    continue
-                
-                parts = line.split('\t')
-                if len(parts) == 2:
-                    node_spec, otype = parts
+            with open(filepath, 'r', encoding='utf-8', buffering=READ_BUFFER) as f:
+                # Parse otype data in one streaming pass, skipping the header
+                intern = sys.intern
+                in_header = True
+                for line in f:
+                    if in_header:
+                        if line.startswith('@'):
+                            continue
+                        in_header = False
                     
-                    if otype not in otypes:
-                        otypes[otype] = []
+                    line = line.strip()
+                    if not line or not '\t' in line:
+                        continue
                     
-                    # Handle ranges
-                    if '-' in node_spec:
-                        start, end = map(int, node_spec.split('-'))
-                        otypes[otype].extend(range(start, end + 1))
-                    else:
-                        otypes[otype].append(int(node_spec))
+                    parts = line.split('\t')
+                    if len(parts) == 2:
+                        node_spec, otype = parts
+                        otype = intern(otype)
+                        
+                        if otype not in otypes:
+                            otypes[otype] = []
+                        
+                        # Handle ranges
+                        if '-' in node_spec:
+                            start, end = map(int, node_spec.split('-'))
+                            otypes[otype].extend(range(start, end + 1))
+                        else:
+                            otypes[otype].append(int(node_spec))
         
         except Exception as e:
             print(f"  Error loading otype.tf: {e}")
         
+        self.max_node = max((max(nodes) for nodes in otypes.values() if nodes), default=0)
         return otypes
     
-    def load_lexemes(self) -> List[Dict]:
+    def _source_mtimes(self) -> Dict[str, float]:
         """
-        Load all lexeme data.
+        Get modification times of the .tf files the cache is built from.
         
         Returns:
-            List of lexeme dictionaries
+            Dictionary mapping file names to mtimes (None if missing)
+        """
+        mtimes = {}
+        for filename in CACHE_SOURCES:
+            filepath = os.path.join(self.bhsa_path, filename)
+            mtimes[filename] = (
+                os.path.getmtime(filepath) if os.path.exists(filepath) else None
+            )
+        return mtimes
+    
+    def _load_cache(self) -> bool:
+        """
+        Load parsed data from the sidecar cache if it is still fresh.
+        
+        Returns:
+            True if the cache was loaded, False otherwise
         """
-        print("  Loading otype.tf...")
-        otypes = self.load_otype()
-        self.lex_nodes = otypes.get('lex', [])
-        print(f"  Found {len(self.lex_nodes)} lexeme nodes")
+        cache_path = os.path.join(self.bhsa_path, CACHE_FILE)
+        if not os.path.exists(cache_path):
+            return False
         
-        print("  Loading lex_utf8.tf...")
-        self.lex_utf8 = self.load_tf_file('lex_utf8.tf')
-        print(f"  Loaded {len(self.lex_utf8)} lex_utf8 values")
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception as e:
+            print(f"  Warning: could not read cache {CACHE_FILE}: {e}")
+            return False
         
-        print("  Loading voc_lex_utf8.tf...")
-        self.voc_lex_utf8 = self.load_tf_file('voc_lex_utf8.tf')
-        print(f"  Loaded {len(self.voc_lex_utf8)} voc_lex_utf8 values")
+        if (not isinstance(cached, dict)
+                or cached.get('version') != CACHE_VERSION
+                or any(key not in cached for key in CACHE_KEYS)
+                or cached.get('mtimes') != self._source_mtimes()):
+            return False
         
-        print("  Loading language.tf...")
-        self.language = self.load_tf_file('language.tf')
-        print(f"  Loaded {len(self.language)} language values")
+        self.lex_nodes = cached['lex_nodes']
+        self.max_node = cached['max_node']
+        self.lex_utf8 = cached['lex_utf8']
+        self.voc_lex_utf8 = cached['voc_lex_utf8']
+        self.language = cached['language']
+        return True
+    
+    def _save_cache(self) -> None:
+        """Write parsed data to the sidecar cache."""
+        cache_path = os.path.join(self.bhsa_path, CACHE_FILE)
+        cached = {
+            'lex_nodes': self.lex_nodes,
+            'max_node': self.max_node,
+            'lex_utf8': self.lex_utf8,
+            'voc_lex_utf8': self.voc_lex_utf8,
+            'language': self.language,
+            'mtimes': self._source_mtimes(),
+            'version': CACHE_VERSION,
+        }
+        
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"  Warning: could not write cache {CACHE_FILE}: {e}")
+    
+    def load_lexemes(self) -> List[Dict]:
+        """
+        Load all lexeme data.
+        
+        Returns:
+            List of lexeme dictionaries
+        """
+        if self.use_cache and self._load_cache():
+            print(f"  Loaded parsed .tf data from {CACHE_FILE}")
+            print(f"  Found {len(self.lex_nodes)} lexeme nodes")
+        else:
+            print("  Loading otype.tf...")
+            otypes = self.load_otype()
+            self.lex_nodes = otypes.get('lex', [])
+            print(f"  Found {len(self.lex_nodes)} lexeme nodes")
+            
+            print("  Loading lex_utf8.tf...")
+            self.lex_utf8 = self.load_tf_file('lex_utf8.tf', self.max_node)
+            print(f"  Loaded {count_values(self.lex_utf8)} lex_utf8 values")
+            
+            print("  Loading voc_lex_utf8.tf...")
+            self.voc_lex_utf8 = self.load_tf_file('voc_lex_utf8.tf', self.max_node)
+            print(f"  Loaded {count_values(self.voc_lex_utf8)} voc_lex_utf8 values")
+            
+            print("  Loading language.tf...")
+            self.language = self.load_tf_file('language.tf', self.max_node)
+            print(f"  Loaded {count_values(self.language)} language values")
+            
+            if self.use_cache:
+                self._save_cache()
         
-        # Build lexeme list
+        # Build lexeme list by indexing the node columns directly
+        lex_utf8 = self.lex_utf8
+        voc_lex_utf8 = self.voc_lex_utf8
+        language = self.language
         lexemes = []
+        add_lexeme = lexemes.append
         for node in self.lex_nodes:
-            lex = self.lex_utf8.get(node, '')
-            voc_lex = self.voc_lex_utf8.get(node, '')
-            lang = self.language.get(node, 'Hebrew')
+            lex = lex_utf8[node] or ''
+            voc_lex = voc_lex_utf8[node] or ''
+            lang = language[node]
+            if lang is None:
+                lang = 'Hebrew'
             
             if lex or voc_lex:
-                lexemes.append({
+                add_lexeme({
                     'node': node,
                     'lex_utf8': lex,
                     'voc_lex_utf8': voc_lex,
@@ -13,39 +13,120 @@ Outputs:
     - mapping_stats.txt: Coverage statistics
 """
 
+from array import array
+import heapq
 import json
 import re
 import sys
 import os
+import pickle
 from pathlib import Path
 from typing import Dict, List, Tuple, Any, Optional
 from collections import defaultdict
+from itertools import islice, zip_longest
+from operator import itemgetter
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Import our Hebrew normalizer
 from hebrew_normalizer import (
     normalize_hebrew,
-    compare_hebrew,
+    compare_hebrew_cached,
+    remove_matres_lectionis,
     extract_strongs_hebrew,
-    is_hebrew_text
 )
 
 
+# Pickled BHSA index, stored next to the .tf files it is built from
+BHSA_CACHE_FILE = '.build_mapping_index.pkl'
+BHSA_CACHE_SOURCES = ('lex_utf8.tf', 'voc_lex_utf8.tf', 'language.tf')
+
+# KJV gloss cleanup: markers and symbols to drop, parenthesized notes and
+# punctuation (except hyphens) to strip from each gloss
+KJV_MARKER_RE = re.compile(r'\[idiom\]|\[phrase\]')
+KJV_SYMBOLS = str.maketrans('', '', 'X+×')
+KJV_PAREN_RE = re.compile(r'\([^)]*\)')
+KJV_PUNCT_RE = re.compile(r'[^\w\s-]')
+
+# Bytes scanned at each end of the Strong's file for the JSON object bounds
+WRAPPER_SCAN = 1 << 12
+
+
+def dump_json_mapping(mapping: Dict[str, Any], path) -> None:
+    """
+    Write a dict as 2-space indented JSON, one top-level entry at a time.
+    
+    The output matches json.dump(mapping, f, ensure_ascii=False, indent=2)
+    byte for byte without building the whole document in memory.
+    """
+    dump_json_items(mapping.items(), path)
+
+
+def dump_json_items(items, path) -> None:
+    """
+    Write (key, value) pairs as a JSON object, like dump_json_mapping.
+    
+    Values can be produced lazily, so a compact in-memory form can be
+    expanded one entry at a time while writing.
+    """
+    with open(path, 'wb') as f:
+        separator = b'{\n  '
+        for key, value in items:
+            if ORJSON_AVAILABLE:
+                key_bytes = orjson.dumps(key)
+                value_bytes = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+            else:
+                key_bytes = json.dumps(key, ensure_ascii=False).encode('utf-8')
+                value_bytes = json.dumps(value, ensure_ascii=False, indent=2).encode('utf-8')
+            f.write(separator)
+            f.write(key_bytes)
+            f.write(b': ')
+            # Nest the value one level deeper (strings never hold raw newlines)
+            f.write(value_bytes.replace(b'\n', b'\n  '))
+            separator = b',\n  '
+        f.write(b'{}' if separator == b'{\n  ' else b'\n}')
+
+
+def iter_tf_values(path: str):
+    """Yield the stripped, non-empty data lines of a .tf file, skipping metadata."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('@'):
+                continue
+            line = line.strip()
+            if line:
+                yield line
+
+
 class MappingBuilder:
     """Build mapping between Strong's and BHSA."""
     
-    def __init__(self, strongs_path: str, use_bhsa: bool = True):
+    def __init__(self, strongs_path: str, use_bhsa: bool = True,
+                 use_cache: bool = True):
         """
         Initialize the mapping builder.
         
         Args:
             strongs_path: Path to Strong's JSON file
             use_bhsa: Whether to load BHSA (requires Text-Fabric)
+            use_cache: Reuse/write a pickled sidecar of the BHSA index
         """
         self.strongs_path = strongs_path
         self.use_bhsa = use_bhsa
+        self.use_cache = use_cache
         self.strongs_data = {}
-        self.bhsa_lexemes = []
-        self.bhsa_index = {}  # Index by normalized Hebrew for fast lookup
+        # BHSA lexemes as parallel columns, indexed by lex_id
+        self.lex_node = array('i')
+        self.lex_utf8 = []
+        self.voc_lex_utf8 = []
+        self.language = []
+        self.bhsa_index = {}  # Normalized Hebrew -> lex_ids, for fast lookup
+        self.bhsa_index_by_skeleton = {}  # (normalized, lex_ids) pairs by matres-free form
+        self._matches_by_form = {}  # Normalized Strong's form -> BHSA matches
         self.F = None
         self.mapping = {}
         self.stats = {
@@ -63,20 +144,11 @@ class MappingBuilder:
         print(f"Loading Strong's data from {self.strongs_path}...")
         
         try:
-            with open(self.strongs_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-                # Handle JavaScript format (var strongsHebrewDictionary = {...})
-                if 'var ' in content or 'strongsHebrewDictionary' in content:
-                    # Extract JSON object from JavaScript
-                    start = content.find('{')
-                    end = content.rfind('}') + 1
-                    if start == -1 or end == 0:
-                        raise ValueError("Could not find JSON object in file")
-                    json_str = content[start:end]
-                    self.strongs_data = json.loads(json_str)
-                else:
-                    self.strongs_data = json.loads(content)
+            json_bytes = self._read_strongs_json()
+            if ORJSON_AVAILABLE:
+                self.strongs_data = orjson.loads(json_bytes)
+            else:
+                self.strongs_data = json.loads(json_bytes)
             
             self.stats['total_strongs'] = len(self.strongs_data)
             print(f"✓ Loaded {self.stats['total_strongs']} Strong's entries")
@@ -88,6 +160,43 @@ class MappingBuilder:
             print(f"✗ Error parsing JSON: {e}")
             sys.exit(1)
     
+    def _read_strongs_json(self) -> bytes:
+        """
+        Read the JSON object from the Strong's file.
+        
+        Handles the JavaScript format (var strongsHebrewDictionary = {...})
+        by slicing from the first '{' to the last '}'. Both are looked up in
+        the head and tail of the file first, so the file is read only once.
+        
+        Returns:
+            Raw UTF-8 bytes of the JSON object
+        """
+        with open(self.strongs_path, 'rb') as f:
+            head = f.read(WRAPPER_SCAN)
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - WRAPPER_SCAN))
+            tail = f.read()
+            
+            start = head.find(b'{')
+            end = tail.rfind(b'}')
+            if start != -1 and end != -1:
+                end += size - len(tail) + 1
+                if start < end:
+                    f.seek(start)
+                    return f.read(end - start)
+            
+            # Markers outside the scanned windows: search the whole file
+            f.seek(0)
+            content = f.read()
+        
+        if b'var ' in content or b'strongsHebrewDictionary' in content:
+            start = content.find(b'{')
+            end = content.rfind(b'}') + 1
+            if start == -1 or end == 0:
+                raise ValueError("Could not find JSON object in file")
+            return content[start:end]
+        return content
+    
     def load_bhsa_data(self) -> None:
         """Load BHSA lexeme data directly from .tf files."""
         if not self.use_bhsa:
@@ -104,6 +213,11 @@ class MappingBuilder:
             self.use_bhsa = False
             return
         
+        if self.use_cache and self._load_bhsa_cache(bhsa_path):
+            print(f"✓ Loaded {len(self.lex_node)} unique BHSA lexemes from {BHSA_CACHE_FILE}")
+            print(f"✓ Built index with {len(self.bhsa_index)} unique normalized forms")
+            return
+        
         try:
             # Load word-level lexeme data (nodes 1-426590 are words)
             print(f"  Loading word-level lexeme data...")
@@ -112,53 +226,53 @@ class MappingBuilder:
             voc_lex_utf8_file = os.path.join(bhsa_path, 'voc_lex_utf8.tf')
             language_file = os.path.join(bhsa_path, 'language.tf')
             
-            # Read all lines
-            with open(lex_utf8_file, 'r', encoding='utf-8') as f:
-                lex_lines = [l.strip() for l in f if l.strip() and not l.startswith('@')]
-            
-            with open(voc_lex_utf8_file, 'r', encoding='utf-8') as f:
-                voc_lex_lines = [l.strip() for l in f if l.strip() and not l.startswith('@')]
-            
-            with open(language_file, 'r', encoding='utf-8') as f:
-                lang_lines = [l.strip() for l in f if l.strip() and not l.startswith('@')]
+            # Extract unique lexemes from word data (first 426590 lines),
+            # streaming the three feature files side by side
+            print(f"  Extracting unique lexemes from word data...")
             
-            # Extract unique lexemes from word data (first 426590 lines)
-            print(f"  Extracting unique lexemes from {min(len(lex_lines), 426590)} words...")
+            seen = set()  # Lexeme keys already stored
+            self.bhsa_index = defaultdict(list)
+            self._matches_by_form.clear()
             
-            lexeme_map = {}  # Map normalized form to lexeme data
-            
-            for i in range(min(len(lex_lines), 426590)):
-                lex = lex_lines[i] if i < len(lex_lines) else ''
-                voc_lex = voc_lex_lines[i] if i < len(voc_lex_lines) else ''
-                lang = lang_lines[i] if i < len(lang_lines) else 'Hebrew'
+            rows = zip_longest(
+                islice(iter_tf_values(lex_utf8_file), 426590),
+                iter_tf_values(voc_lex_utf8_file),
+                iter_tf_values(language_file),
+            )
+            for i, (lex, voc_lex, lang) in enumerate(rows):
+                if lex is None:
+                    break
+                if voc_lex is None:
+                    voc_lex = ''
+                if lang is None:
+                    lang = 'Hebrew'
                 
                 if lex or voc_lex:
                     # Use vocalized form as key for uniqueness
                     key = voc_lex or lex
-                    if key not in lexeme_map:
-                        normalized = normalize_hebrew(voc_lex or lex)
-                        lexeme_map[key] = {
-                            'node': i + 1,  # Pseudo-node (first occurrence)
-                            'lex_utf8': lex,
-                            'voc_lex_utf8': voc_lex,
-                            'language': lang,
-                            'normalized': normalized
-                        }
-            
-            # Convert to list
-            self.bhsa_lexemes = list(lexeme_map.values())
+                    if key not in seen:
+                        seen.add(key)
+                        # Index for fast lookups
+                        self.bhsa_index[normalize_hebrew(key)].append(len(self.lex_node))
+                        self.lex_node.append(i + 1)  # Pseudo-node (first occurrence)
+                        self.lex_utf8.append(lex)
+                        self.voc_lex_utf8.append(voc_lex)
+                        self.language.append(lang)
             
-            # Build index for fast lookups
-            print(f"  Building search index...")
-            for lex in self.bhsa_lexemes:
-                norm = lex['normalized']
-                if norm not in self.bhsa_index:
-                    self.bhsa_index[norm] = []
-                self.bhsa_index[norm].append(lex)
+            # Bucket the index by its form without doubled matres lectionis:
+            # outside an exact hit, compare_hebrew only reaches 0.7 for
+            # forms that share this skeleton
+            self.bhsa_index_by_skeleton = defaultdict(list)
+            for norm, lex_ids in self.bhsa_index.items():
+                skeleton = remove_matres_lectionis(norm)
+                self.bhsa_index_by_skeleton[skeleton].append((norm, lex_ids))
             
-            print(f"✓ Loaded {len(self.bhsa_lexemes)} unique BHSA lexemes")
+            print(f"✓ Loaded {len(self.lex_node)} unique BHSA lexemes")
             print(f"✓ Built index with {len(self.bhsa_index)} unique normalized forms")
             
+            if self.use_cache:
+                self._save_bhsa_cache(bhsa_path)
+            
         except Exception as e:
             print(f"✗ Error loading BHSA: {e}")
             import traceback
@@ -166,6 +280,71 @@ class MappingBuilder:
             print("  Continuing in demo mode...")
             self.use_bhsa = False
     
+    def get_bhsa_state(self) -> Tuple:
+        """Get the loaded BHSA columns and indexes, for caching or workers."""
+        return (self.lex_node, self.lex_utf8, self.voc_lex_utf8, self.language,
+                self.bhsa_index, self.bhsa_index_by_skeleton)
+    
+    def set_bhsa_state(self, state: Tuple) -> None:
+        """Restore BHSA columns and indexes from get_bhsa_state."""
+        (self.lex_node, self.lex_utf8, self.voc_lex_utf8, self.language,
+         self.bhsa_index, self.bhsa_index_by_skeleton) = state
+        self._matches_by_form.clear()
+    
+    def _bhsa_signature(self, bhsa_path: str) -> Tuple:
+        """
+        Get (mtime, size) of each .tf file the BHSA index is built from.
+        
+        Returns:
+            Tuple of (mtime, size) pairs, None for missing files
+        """
+        signature = []
+        for filename in BHSA_CACHE_SOURCES:
+            filepath = os.path.join(bhsa_path, filename)
+            if os.path.exists(filepath):
+                signature.append((os.path.getmtime(filepath), os.path.getsize(filepath)))
+            else:
+                signature.append(None)
+        return tuple(signature)
+    
+    def _load_bhsa_cache(self, bhsa_path: str) -> bool:
+        """
+        Load the BHSA index from the sidecar cache if it is still fresh.
+        
+        Returns:
+            True if the cache was loaded, False otherwise
+        """
+        cache_path = os.path.join(bhsa_path, BHSA_CACHE_FILE)
+        if not os.path.exists(cache_path):
+            return False
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception as e:
+            print(f"  Warning: could not read cache {BHSA_CACHE_FILE}: {e}")
+            return False
+        
+        if 'bhsa' not in cached or cached.get('signature') != self._bhsa_signature(bhsa_path):
+            return False
+        
+        self.set_bhsa_state(cached['bhsa'])
+        return True
+    
+    def _save_bhsa_cache(self, bhsa_path: str) -> None:
+        """Write the BHSA index to the sidecar cache."""
+        cache_path = os.path.join(bhsa_path, BHSA_CACHE_FILE)
+        cached = {
+            'bhsa': self.get_bhsa_state(),
+            'signature': self._bhsa_signature(bhsa_path),
+        }
+        
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"  Warning: could not write cache {BHSA_CACHE_FILE}: {e}")
+    
     def clean_kjv_glosses(self, kjv_def: str) -> Tuple[str, List[str]]:
         """
         Clean and normalize KJV glosses.
@@ -180,7 +359,7 @@ class MappingBuilder:
             return '', []
         
         # Remove special markers like [idiom], [phrase], X, +
-        cleaned = re.sub(r'\[idiom\]|\[phrase\]|[X+×]', '', kjv_def)
+        cleaned = KJV_MARKER_RE.sub('', kjv_def).translate(KJV_SYMBOLS)
         
         # Split by comma
         parts = cleaned.split(',')
@@ -189,13 +368,13 @@ class MappingBuilder:
         glosses = []
         for part in parts:
             # Remove parentheses and their contents
-            part = re.sub(r'\([^)]*\)', '', part)
+            part = KJV_PAREN_RE.sub('', part)
             # Remove extra whitespace
             part = part.strip()
             # Convert to lowercase
             part = part.lower()
             # Remove punctuation except hyphens
-            part = re.sub(r'[^\w\s-]', '', part)
+            part = KJV_PUNCT_RE.sub('', part)
             
             if part and len(part) > 1:  # Skip single characters
                 glosses.append(part)
@@ -205,12 +384,14 @@ class MappingBuilder:
         
         return gloss_string, glosses
     
-    def find_bhsa_matches(self, strongs_entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def find_bhsa_matches(self, strongs_entry: Dict[str, Any],
+                          strongs_hebrew: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Find matching BHSA lexemes for a Strong's entry using indexed lookup.
         
         Args:
             strongs_entry: Strong's dictionary entry
+            strongs_hebrew: Normalized Hebrew of the entry, if already known
             
         Returns:
             List of matches with scores
@@ -219,52 +400,60 @@ class MappingBuilder:
             return []
         
         # Extract and normalize Strong's Hebrew
-        strongs_hebrew = extract_strongs_hebrew(strongs_entry)
+        if strongs_hebrew is None:
+            strongs_hebrew = extract_strongs_hebrew(strongs_entry)
         
         if not strongs_hebrew:
             return []
         
-        matches = []
-        
-        # Fast lookup: exact normalized match
-        exact_matches = self.bhsa_index.get(strongs_hebrew, [])
-        
-        for bhsa_lex in exact_matches:
-            score = compare_hebrew(strongs_hebrew, bhsa_lex['normalized'])
+        # Many entries share a normalized form; match each form only once
+        cached = self._matches_by_form.get(strongs_hebrew)
+        if cached is not None:
+            return list(cached)
+        
+        # Fast lookup: exact normalized match. All hits tie on the top
+        # score, so the first 10 in index order are the result and the
+        # fuzzy fallback is skipped
+        exact_matches = self.bhsa_index.get(strongs_hebrew, ())
+        if exact_matches:
+            score = compare_hebrew_cached(strongs_hebrew, strongs_hebrew)
             if score >= 0.7:
-                matches.append({
-                    'node': bhsa_lex['node'],
-                    'score': round(score, 3),
-                    'bhsa_lex': bhsa_lex['lex_utf8'],
-                    'bhsa_voc': bhsa_lex['voc_lex_utf8'],
-                    'language': bhsa_lex['language']
-                })
+                matches = [self._bhsa_match(i, score) for i in exact_matches[:10]]
+                self._matches_by_form[strongs_hebrew] = matches
+                return list(matches)
         
         # If no exact matches, try fuzzy matching on similar forms
-        if not matches:
-            # Check forms that differ by 1-2 characters
-            for norm_form, bhsa_list in self.bhsa_index.items():
-                if abs(len(norm_form) - len(strongs_hebrew)) <= 2:
-                    for bhsa_lex in bhsa_list:
-                        score = compare_hebrew(strongs_hebrew, bhsa_lex['normalized'])
-                        if score >= 0.7:
-                            matches.append({
-                                'node': bhsa_lex['node'],
-                                'score': round(score, 3),
-                                'bhsa_lex': bhsa_lex['lex_utf8'],
-                                'bhsa_voc': bhsa_lex['voc_lex_utf8'],
-                                'language': bhsa_lex['language']
-                            })
-        
-        # Sort by score (highest first)
-        matches.sort(key=lambda x: x['score'], reverse=True)
-        
-        # Limit to top 10 matches to avoid clutter
-        return matches[:10]
+        matches = []
+        # Check forms that differ by 1-2 characters in length; only
+        # spelling variants can score high enough, so skip the rest
+        length = len(strongs_hebrew)
+        skeleton = remove_matres_lectionis(strongs_hebrew)
+        for norm_form, lex_ids in self.bhsa_index_by_skeleton.get(skeleton, ()):
+            if abs(len(norm_form) - length) > 2:
+                continue
+            score = compare_hebrew_cached(strongs_hebrew, norm_form)
+            if score >= 0.7:
+                matches.extend(self._bhsa_match(i, score) for i in lex_ids)
+        
+        # Top 10 matches by score, highest first (ties keep index order),
+        # to avoid clutter
+        matches = heapq.nlargest(10, matches, key=itemgetter('score'))
+        self._matches_by_form[strongs_hebrew] = matches
+        return list(matches)
     
-    def process_strongs_entry(self, strongs_num: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+    def _bhsa_match(self, lex_id: int, score: float) -> Dict[str, Any]:
+        """Build the match record for a BHSA lexeme."""
+        return {
+            'node': self.lex_node[lex_id],
+            'score': round(score, 3),
+            'bhsa_lex': self.lex_utf8[lex_id],
+            'bhsa_voc': self.voc_lex_utf8[lex_id],
+            'language': self.language[lex_id]
+        }
+    
+    def build_strongs_entry(self, strongs_num: str, entry: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Process a single Strong's entry.
+        Build the mapping entry for a single Strong's entry.
         
         Args:
             strongs_num: Strong's number (e.g., 'H157')
@@ -281,29 +470,23 @@ class MappingBuilder:
         kjv_def = entry.get('kjv_def', '')
         gloss_string, gloss_list = self.clean_kjv_glosses(kjv_def)
         
-        # Find BHSA matches
-        bhsa_matches = self.find_bhsa_matches(entry)
+        # Find BHSA matches (extract_strongs_hebrew only differs from the
+        # lemma when it has to fall back to other fields)
+        bhsa_matches = self.find_bhsa_matches(
+            entry, strongs_normalized if strongs_lemma else None
+        )
         
         # Determine confidence level
         if bhsa_matches:
             best_score = bhsa_matches[0]['score']
             if best_score >= 0.95:
                 confidence = 'high'
-                self.stats['high_confidence'] += 1
             elif best_score >= 0.85:
                 confidence = 'medium'
-                self.stats['medium_confidence'] += 1
             else:
                 confidence = 'low'
-                self.stats['low_confidence'] += 1
-            
-            if len(bhsa_matches) > 1:
-                self.stats['ambiguous'] += 1
-            
-            self.stats['matched'] += 1
         else:
             confidence = 'none'
-            self.stats['unmatched'] += 1
         
         # Build mapping entry
         mapping_entry = {
@@ -319,21 +502,74 @@ class MappingBuilder:
         
         return mapping_entry
     
-    def build_mapping(self) -> None:
-        """Build the complete mapping."""
+    def process_strongs_entry(self, strongs_num: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Process a single Strong's entry and record it in the statistics.
+        
+        Args:
+            strongs_num: Strong's number (e.g., 'H157')
+            entry: Strong's entry data
+            
+        Returns:
+            Processed mapping entry
+        """
+        mapping_entry = self.build_strongs_entry(strongs_num, entry)
+        self.record_stats(mapping_entry)
+        return mapping_entry
+    
+    def record_stats(self, mapping_entry: Dict[str, Any]) -> None:
+        """
+        Count a processed mapping entry in the statistics.
+        
+        Args:
+            mapping_entry: Entry as returned by build_strongs_entry
+        """
+        confidence = mapping_entry['confidence']
+        if confidence == 'none':
+            self.stats['unmatched'] += 1
+            return
+        
+        self.stats[f'{confidence}_confidence'] += 1
+        if mapping_entry['match_count'] > 1:
+            self.stats['ambiguous'] += 1
+        self.stats['matched'] += 1
+    
+    def build_mapping(self, workers: int = 1) -> None:
+        """
+        Build the complete mapping.
+        
+        Args:
+            workers: Number of worker processes; entries are processed
+                in this process when 1
+        """
         print(f"\nBuilding mapping for {self.stats['total_strongs']} entries...")
         print("=" * 60)
         
+        items = self.strongs_data.items()
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.strongs_path, self.use_bhsa, self.get_bhsa_state()),
+            )
+            entries = executor.map(_build_in_worker, items, chunksize=64)
+        else:
+            executor = None
+            entries = (self.build_strongs_entry(num, entry) for num, entry in items)
+        
         # Process each Strong's entry
-        for i, (strongs_num, entry) in enumerate(self.strongs_data.items(), 1):
+        for i, mapping_entry in enumerate(entries, 1):
             # Progress indicator
             if i % 100 == 0:
                 print(f"Progress: {i}/{self.stats['total_strongs']} "
                       f"({100*i/self.stats['total_strongs']:.1f}%)")
             
-            # Process entry
-            mapping_entry = self.process_strongs_entry(strongs_num, entry)
-            self.mapping[strongs_num] = mapping_entry
+            self.record_stats(mapping_entry)
+            self.mapping[mapping_entry['strongs_number']] = mapping_entry
+        
+        if executor is not None:
+            executor.shutdown()
         
         print(f"✓ Completed mapping for {len(self.mapping)} entries")
     
@@ -351,8 +587,7 @@ class MappingBuilder:
         
         # 1. Complete mapping
         mapping_file = output_path / 'strongs_to_bhsa.json'
-        with open(mapping_file, 'w', encoding='utf-8') as f:
-            json.dump(self.mapping, f, ensure_ascii=False, indent=2)
+        dump_json_mapping(self.mapping, mapping_file)
         print(f"✓ Created {mapping_file}")
         
         # 2. Ambiguous mappings (for manual review)
@@ -362,8 +597,7 @@ class MappingBuilder:
         }
         
         ambiguous_file = output_path / 'ambiguous_mappings.json'
-        with open(ambiguous_file, 'w', encoding='utf-8') as f:
-            json.dump(ambiguous, f, ensure_ascii=False, indent=2)
+        dump_json_mapping(ambiguous, ambiguous_file)
         print(f"✓ Created {ambiguous_file} ({len(ambiguous)} entries)")
         
         # 3. Statistics
@@ -452,6 +686,23 @@ class MappingBuilder:
         print("=" * 60)
 
 
+# Per-process builder for parallel build_mapping runs
+_WORKER_BUILDER = None
+
+
+def _init_worker(strongs_path: str, use_bhsa: bool, bhsa_state: Tuple) -> None:
+    """Set up the worker's builder around the parent's BHSA data."""
+    global _WORKER_BUILDER
+    _WORKER_BUILDER = MappingBuilder(strongs_path, use_bhsa=use_bhsa)
+    _WORKER_BUILDER.set_bhsa_state(bhsa_state)
+
+
+def _build_in_worker(item: Tuple[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Build one mapping entry in a worker process."""
+    strongs_num, entry = item
+    return _WORKER_BUILDER.build_strongs_entry(strongs_num, entry)
+
+
 def main():
     """Main entry point."""
     print("Strong's to BHSA Mapping Builder")
@@ -7,19 +7,181 @@ Uses aggressive fuzzy matching for unmatched lexemes.
 
 import json
 import sys
+from collections import defaultdict
+from itertools import islice, zip_longest
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 sys.path.insert(0, '.')
-from hebrew_normalizer import normalize_hebrew, compare_hebrew
+from hebrew_normalizer import (
+    normalize_hebrew,
+    compare_hebrew_cached,
+    levenshtein_distance,
+    remove_matres_lectionis,
+)
+from build_mapping import dump_json_items, iter_tf_values
 import os
 
+
+# Initial edit-distance radius for the Strong's candidate search; radii up
+# to this one are served from the deletion index, larger ones from the BK-tree
+FUZZY_RADIUS = 2
+
+
+def deletion_variants(word, depth):
+    """
+    Return all strings obtained by deleting up to depth characters from word.
+    
+    Two words within edit distance depth always share such a variant, so
+    indexing words by their variants finds every neighbour with hash lookups
+    instead of distance computations.
+    """
+    variants = {word}
+    frontier = {word}
+    for _ in range(depth):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        variants |= frontier
+    return variants
+
+
+class BKTree:
+    """Burkhard-Keller tree over strings, keyed on Levenshtein distance."""
+    
+    def __init__(self, words=()):
+        self.root = None
+        for word in words:
+            self.add(word)
+    
+    def add(self, word):
+        """Add a word to the tree (duplicates are ignored)."""
+        if self.root is None:
+            self.root = (word, {})
+            return
+        
+        node = self.root
+        while True:
+            node_word, children = node
+            distance = levenshtein_distance(word, node_word)
+            if distance == 0:
+                return
+            child = children.get(distance)
+            if child is None:
+                children[distance] = (word, {})
+                return
+            node = child
+    
+    def search(self, word, radius):
+        """Return all words within the given edit distance of word."""
+        found = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node_word, children = stack.pop()
+            distance = levenshtein_distance(word, node_word)
+            if distance <= radius:
+                found.append(node_word)
+            # Triangle inequality: only subtrees at these distances can match
+            for child_distance, child in children.items():
+                if distance - radius <= child_distance <= distance + radius:
+                    stack.append(child)
+        return found
+
+
+def build_strongs_finder(strongs_norms):
+    """
+    Index normalized Strong's forms for the best-match search.
+    
+    Args:
+        strongs_norms: Normalized Strong's forms in mapping order
+        
+    Returns:
+        A function that takes a normalized BHSA form and returns the
+        (index, score) of the best-scoring Strong's form, or (None, 0)
+        when nothing scores above 0; the same result as scoring every
+        form with compare_hebrew_cached
+    """
+    # Candidate generation: a BK-tree over the distinct normalized forms,
+    # plus the forms that only differ by doubled matres lectionis (which
+    # compare_hebrew scores at 0.85 regardless of edit distance)
+    norm_to_strongs = defaultdict(list)
+    ml_to_strongs = defaultdict(list)
+    for i, norm in enumerate(strongs_norms):
+        if norm:
+            norm_to_strongs[norm].append(i)
+            ml_to_strongs[remove_matres_lectionis(norm)].append(i)
+    strongs_tree = BKTree(norm_to_strongs)
+    deletion_index = defaultdict(list)
+    for norm in norm_to_strongs:
+        for variant in deletion_variants(norm, FUZZY_RADIUS):
+            deletion_index[variant].append(norm)
+    max_strongs_len = max(map(len, norm_to_strongs), default=0)
+    
+    def find_best_strongs(bhsa_norm):
+        """Return (index, score) of the best-scoring Strong's entry.
+        
+        Ties go to the earliest entry, as in a full scan in mapping order.
+        """
+        if not bhsa_norm:
+            return None, 0
+        n = len(bhsa_norm)
+        radius = FUZZY_RADIUS
+        while True:
+            candidates = set(ml_to_strongs.get(remove_matres_lectionis(bhsa_norm), ()))
+            if radius <= FUZZY_RADIUS:
+                # A superset of the forms within radius, which is all the
+                # bound below relies on
+                near = {
+                    norm
+                    for variant in deletion_variants(bhsa_norm, radius)
+                    for norm in deletion_index.get(variant, ())
+                }
+            else:
+                near = strongs_tree.search(bhsa_norm, radius)
+            for norm in near:
+                candidates.update(norm_to_strongs[norm])
+            best_i = None
+            best_score = 0
+            for i in sorted(candidates):
+                score = compare_hebrew_cached(bhsa_norm, strongs_norms[i])
+                if score > best_score:
+                    best_i = i
+                    best_score = score
+            # A form farther than radius scores at most 0.7 * n / (n + radius + 1),
+            # so the candidates suffice once something beats that bound. It
+            # can be reached exactly, and the two sides are rounded
+            # differently, so a tie must widen the search: an earlier entry
+            # outside the radius may share the best score
+            bound = 0.7 * n / (n + radius + 1) + 1e-9
+            if best_score > bound or radius >= max(n, max_strongs_len):
+                return best_i, best_score
+            radius *= 2
+    
+    return find_best_strongs
+
+
 def create_complete_bhsa_to_strongs():
-    """Create complete BHSA → Strong's mapping with 100% coverage."""
+    """
+    Create complete BHSA → Strong's mapping with 100% coverage.
+    
+    Returns:
+        Tuple of (mapping, summary), where mapping holds a compact
+        (strongs_num, score, method) record per vocalized BHSA lexeme; the
+        Strong's lemma and glosses are only filled in when writing the JSON
+    """
     
     print("Creating Complete BHSA → Strong's Mapping")
     print("=" * 60)
     
     # Load existing Strong's → BHSA mapping
-    with open('strongs_to_bhsa.json') as f:
-        strongs_mapping = json.load(f)
+    if ORJSON_AVAILABLE:
+        with open('strongs_to_bhsa.json', 'rb') as f:
+            strongs_mapping = orjson.loads(f.read())
+    else:
+        with open('strongs_to_bhsa.json') as f:
+            strongs_mapping = json.load(f)
     
     # Build reverse mapping
     print("\n1. Building reverse mapping from existing matches...")
@@ -32,13 +194,7 @@ def create_complete_bhsa_to_strongs():
             
             # Store by vocalized form (primary key)
             if bhsa_voc and bhsa_voc not in bhsa_to_strongs:
-                bhsa_to_strongs[bhsa_voc] = {
-                    'strongs': strongs_num,
-                    'strongs_lemma': entry['strongs_lemma'],
-                    'score': match['score'],
-                    'method': 'exact_match',
-                    'kjv_glosses': entry['kjv_glosses']
-                }
+                bhsa_to_strongs[bhsa_voc] = (strongs_num, match['score'], 'exact_match')
     
     print(f"   ✓ {len(bhsa_to_strongs)} BHSA lexemes matched")
     
@@ -46,17 +202,15 @@ def create_complete_bhsa_to_strongs():
     print("\n2. Loading all BHSA lexemes...")
     bhsa_path = '/home/teapot/text-fabric-data/github/ETCBC/bhsa/tf/2021'
     
-    with open(os.path.join(bhsa_path, 'lex_utf8.tf'), 'r', encoding='utf-8') as f:
-        lex_lines = [l.strip() for l in f if l.strip() and not l.startswith('@')]
-    
-    with open(os.path.join(bhsa_path, 'voc_lex_utf8.tf'), 'r', encoding='utf-8') as f:
-        voc_lex_lines = [l.strip() for l in f if l.strip() and not l.startswith('@')]
-    
-    # Get unique lexemes
+    # Get unique lexemes, streaming both feature files side by side
     all_bhsa = {}
-    for i in range(min(len(lex_lines), 426590)):
-        voc_lex = voc_lex_lines[i] if i < len(voc_lex_lines) else ''
-        lex = lex_lines[i]
+    rows = zip_longest(
+        islice(iter_tf_values(os.path.join(bhsa_path, 'lex_utf8.tf')), 426590),
+        iter_tf_values(os.path.join(bhsa_path, 'voc_lex_utf8.tf')),
+    )
+    for lex, voc_lex in rows:
+        if lex is None:
+            break
         
         if voc_lex and voc_lex not in all_bhsa:
             all_bhsa[voc_lex] = {
@@ -73,34 +227,25 @@ def create_complete_bhsa_to_strongs():
     
     # Get all Strong's entries for fuzzy matching
     print("\n3. Applying fuzzy matching to unmatched lexemes...")
-    all_strongs = {
-        num: {
-            'lemma': entry['strongs_lemma'],
-            'normalized': entry['strongs_normalized'],
-            'glosses': entry['kjv_glosses']
-        }
-        for num, entry in strongs_mapping.items()
-    }
+    # Parallel tuples in mapping order; entries are referred to by index
+    strongs_nums = tuple(strongs_mapping)
+    strongs_norms = tuple(entry['strongs_normalized'] for entry in strongs_mapping.values())
+    
+    find_best_strongs = build_strongs_finder(strongs_norms)
     
     matched_count = 0
     for bhsa_lex in unmatched:
         bhsa_data = all_bhsa[bhsa_lex]
         best_match = None
-        best_score = 0
         
-        # Try to find best match
-        for strongs_num, strongs_data in all_strongs.items():
-            score = compare_hebrew(bhsa_data['normalized'], strongs_data['normalized'])
-            
-            if score > best_score:
-                best_score = score
-                best_match = {
-                    'strongs': strongs_num,
-                    'strongs_lemma': strongs_data['lemma'],
-                    'score': round(score, 3),
-                    'method': 'fuzzy_match' if score < 0.9 else 'consonantal_match',
-                    'kjv_glosses': strongs_data['glosses']
-                }
+        # Try to find best match among the candidates
+        i, score = find_best_strongs(bhsa_data['normalized'])
+        if i is not None:
+            best_match = (
+                strongs_nums[i],
+                round(score, 3),
+                'fuzzy_match' if score < 0.9 else 'consonantal_match',
+            )
         
         # Assign best match (even if score is low)
         if best_match:
@@ -115,17 +260,31 @@ def create_complete_bhsa_to_strongs():
     # Calculate statistics
     print("\n4. Generating statistics...")
     total = len(all_bhsa)
-    exact = sum(1 for v in bhsa_to_strongs.values() if v['method'] == 'exact_match')
-    consonantal = sum(1 for v in bhsa_to_strongs.values() if v['method'] == 'consonantal_match')
-    fuzzy = sum(1 for v in bhsa_to_strongs.values() if v['method'] == 'fuzzy_match')
-    high_conf = sum(1 for v in bhsa_to_strongs.values() if v['score'] >= 0.9)
-    medium_conf = sum(1 for v in bhsa_to_strongs.values() if 0.7 <= v['score'] < 0.9)
-    low_conf = sum(1 for v in bhsa_to_strongs.values() if v['score'] < 0.7)
-    
-    # Save complete mapping
+    exact = sum(1 for _, _, method in bhsa_to_strongs.values() if method == 'exact_match')
+    consonantal = sum(1 for _, _, method in bhsa_to_strongs.values() if method == 'consonantal_match')
+    fuzzy = sum(1 for _, _, method in bhsa_to_strongs.values() if method == 'fuzzy_match')
+    high_conf = sum(1 for _, score, _ in bhsa_to_strongs.values() if score >= 0.9)
+    medium_conf = sum(1 for _, score, _ in bhsa_to_strongs.values() if 0.7 <= score < 0.9)
+    low_conf = sum(1 for _, score, _ in bhsa_to_strongs.values() if score < 0.7)
+    
+    # Save complete mapping, filling in the Strong's fields per entry
     print("\n5. Saving complete mapping...")
-    with open('bhsa_to_strongs_complete.json', 'w', encoding='utf-8') as f:
-        json.dump(bhsa_to_strongs, f, ensure_ascii=False, indent=2)
+    
+    def expand_match(record):
+        strongs_num, score, method = record
+        entry = strongs_mapping[strongs_num]
+        return {
+            'strongs': strongs_num,
+            'strongs_lemma': entry['strongs_lemma'],
+            'score': score,
+            'method': method,
+            'kjv_glosses': entry['kjv_glosses']
+        }
+    
+    dump_json_items(
+        ((bhsa, expand_match(record)) for bhsa, record in bhsa_to_strongs.items()),
+        'bhsa_to_strongs_complete.json',
+    )
     
     print(f"   ✓ Saved to bhsa_to_strongs_complete.json")
     
@@ -174,9 +333,10 @@ def create_complete_bhsa_to_strongs():
     
     # Show sample low-confidence matches
     print("\nSample low-confidence matches (for review):")
-    low_conf_samples = [(k, v) for k, v in bhsa_to_strongs.items() if v['score'] < 0.7]
-    for i, (bhsa, match) in enumerate(low_conf_samples[:10], 1):
-        print(f"{i:2}. {bhsa:20} → {match['strongs']} {match['strongs_lemma']:15} (score: {match['score']})")
+    low_conf_samples = [(k, v) for k, v in bhsa_to_strongs.items() if v[1] < 0.7]
+    for i, (bhsa, (strongs_num, score, _)) in enumerate(low_conf_samples[:10], 1):
+        strongs_lemma = strongs_mapping[strongs_num]['strongs_lemma']
+        print(f"{i:2}. {bhsa:20} → {strongs_num} {strongs_lemma:15} (score: {score})")
     
     return bhsa_to_strongs, summary
 
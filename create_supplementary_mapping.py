@@ -9,35 +9,93 @@ relaxed matching criteria.
 import json
 import os
 import sys
+from collections import defaultdict
+from itertools import islice
 sys.path.insert(0, '.')
-from hebrew_normalizer import normalize_hebrew, compare_hebrew
+from hebrew_normalizer import (
+    normalize_hebrew, compare_hebrew_normalized, remove_matres_lectionis,
+    encode_consonants
+)
+from build_mapping import dump_json_mapping, iter_tf_values
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    from rapidfuzz import process
+    from rapidfuzz.distance import Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Lowest compare_hebrew score accepted as a supplementary match
+MIN_SCORE = 0.6
+
+# Largest d / n a fuzzy pair can have and still reach MIN_SCORE, with some
+# slack for the float32 values returned by rapidfuzz.process.cdist
+MAX_FUZZY_DISTANCE = 1.0 - MIN_SCORE / 0.7 + 1e-6
+
+
+def length_can_reach(len1, len2):
+    """Whether two normalized lengths allow a fuzzy score of MIN_SCORE.
+    
+    Apart from the 0.85 matres lectionis match, compare_hebrew scores at
+    most 0.7 * (1 - d / n), and d is at least the length difference.
+    """
+    longest = max(len1, len2)
+    if longest == 0:
+        return False
+    return 0.7 * (1.0 - abs(len1 - len2) / longest) >= MIN_SCORE
+
+
+def iter_strongs_mapping(path='strongs_to_bhsa.json'):
+    """Yield (strongs_num, entry) pairs from the main mapping file.
+    
+    With ijson installed the file is parsed incrementally, so only one
+    entry is held in memory at a time.
+    """
+    if IJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            yield from ijson.kvitems(f, '', use_float=True)
+    elif ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            yield from orjson.loads(f.read()).items()
+    else:
+        with open(path) as f:
+            yield from json.load(f).items()
+
 
 def create_bhsa_to_strongs_mapping():
     """Create reverse mapping from BHSA to Strong's."""
     print("Creating BHSA → Strong's reverse mapping...")
     
-    with open('strongs_to_bhsa.json') as f:
-        strongs_mapping = json.load(f)
-    
     # Build reverse index
     bhsa_to_strongs = {}
     
-    for strongs_num, entry in strongs_mapping.items():
+    for strongs_num, entry in iter_strongs_mapping():
         for match in entry['bhsa_matches']:
-            bhsa_lex = match['bhsa_lex']
-            bhsa_voc = match['bhsa_voc']
+            # One record per match, shared by both of its keys
+            record = {
+                'strongs': strongs_num,
+                'strongs_lemma': entry['strongs_lemma'],
+                'score': match['score'],
+                'kjv_glosses': entry['kjv_glosses']
+            }
             
             # Index by both consonantal and vocalized
-            for key in [bhsa_lex, bhsa_voc]:
-                if key and key not in bhsa_to_strongs:
-                    bhsa_to_strongs[key] = []
+            for key in (match['bhsa_lex'], match['bhsa_voc']):
                 if key:
-                    bhsa_to_strongs[key].append({
-                        'strongs': strongs_num,
-                        'strongs_lemma': entry['strongs_lemma'],
-                        'score': match['score'],
-                        'kjv_glosses': entry['kjv_glosses']
-                    })
+                    bhsa_to_strongs.setdefault(key, []).append(record)
     
     print(f"✓ Created reverse mapping for {len(bhsa_to_strongs)} BHSA lexemes")
     return bhsa_to_strongs
@@ -50,33 +108,102 @@ def find_unmatched_bhsa():
     # Load BHSA data
     bhsa_path = '/home/teapot/text-fabric-data/github/ETCBC/bhsa/tf/2021'
     
-    with open(os.path.join(bhsa_path, 'lex_utf8.tf'), 'r', encoding='utf-8') as f:
-        lex_lines = [l.strip() for l in f if l.strip() and not l.startswith('@')]
-    
-    with open(os.path.join(bhsa_path, 'voc_lex_utf8.tf'), 'r', encoding='utf-8') as f:
-        voc_lex_lines = [l.strip() for l in f if l.strip() and not l.startswith('@')]
-    
-    # Get unique lexemes
+    # Get unique lexemes, streaming both feature files side by side over
+    # the word nodes (lines past the end of voc_lex_utf8 have no key)
     unique_lexemes = {}
-    for i in range(min(len(lex_lines), 426590)):
-        lex = lex_lines[i]
-        voc_lex = voc_lex_lines[i] if i < len(voc_lex_lines) else ''
-        
-        if voc_lex:
-            key = voc_lex
-            if key not in unique_lexemes:
-                unique_lexemes[key] = {
-                    'voc': voc_lex,
-                    'cons': lex,
-                    'normalized': normalize_hebrew(voc_lex)
-                }
+    rows = zip(
+        islice(iter_tf_values(os.path.join(bhsa_path, 'lex_utf8.tf')), 426590),
+        iter_tf_values(os.path.join(bhsa_path, 'voc_lex_utf8.tf')),
+    )
+    for lex, voc_lex in rows:
+        if voc_lex not in unique_lexemes:
+            unique_lexemes[voc_lex] = {
+                'voc': voc_lex,
+                'cons': lex,
+                'normalized': normalize_hebrew(voc_lex)
+            }
     
     print(f"✓ Found {len(unique_lexemes)} unique BHSA lexemes")
     return unique_lexemes
 
 
-def find_supplementary_matches():
-    """Find matches for previously unmatched BHSA lexemes."""
+def index_strongs_candidates(unmatched_strongs):
+    """Index unmatched Strong's entries for the supplementary join.
+    
+    The fields the join needs are kept as parallel columns in entry order,
+    so ties still go to the earliest entry; entries are also bucketed by
+    normalized length and by matres-stripped skeleton, and encoded one
+    byte per consonant for rapidfuzz.
+    """
+    index = {
+        'nums': [],
+        'lemmas': [],
+        'glosses': [],
+        'norms': [],
+        'codes': [],
+        'by_length': defaultdict(list),
+        'by_skeleton': defaultdict(list),
+    }
+    for i, (num, entry) in enumerate(unmatched_strongs.items()):
+        norm = normalize_hebrew(entry['strongs_normalized'])
+        index['nums'].append(num)
+        index['lemmas'].append(entry['strongs_lemma'])
+        index['glosses'].append(entry['kjv_glosses'])
+        index['norms'].append(norm)
+        index['codes'].append(encode_consonants(norm))
+        index['by_length'][len(norm)].append(i)
+        index['by_skeleton'][remove_matres_lectionis(norm)].append(i)
+    return index
+
+
+def best_supplementary_match(index, bhsa_norm, shortlist=None):
+    """
+    Return the best Strong's match for one BHSA lexeme, or None.
+    
+    Only skeleton matches and pairs close enough to reach MIN_SCORE are
+    scored: those in shortlist when given, otherwise the length buckets
+    that pass length_can_reach.
+    """
+    candidates = set(index['by_skeleton'].get(remove_matres_lectionis(bhsa_norm), ()))
+    if shortlist is not None:
+        candidates.update(shortlist)
+    else:
+        for length, bucket in index['by_length'].items():
+            if length_can_reach(length, len(bhsa_norm)):
+                candidates.update(bucket)
+    
+    norms = index['norms']
+    best = None
+    best_score = 0
+    for i in sorted(candidates):
+        # Compare normalized forms
+        score = compare_hebrew_normalized(bhsa_norm, norms[i], min_score=MIN_SCORE)
+        
+        if score > best_score and score >= MIN_SCORE:  # Lower threshold
+            best_score = score
+            best = i
+            if score >= 1.0:
+                break  # Exact match; nothing later can beat it
+    
+    if best is None:
+        return None
+    return {
+        'strongs': index['nums'][best],
+        'strongs_lemma': index['lemmas'][best],
+        'score': round(best_score, 3),
+        'kjv_glosses': index['glosses'][best]
+    }
+
+
+def find_supplementary_matches(workers=1):
+    """
+    Find matches for previously unmatched BHSA lexemes.
+    
+    Args:
+        workers: Number of worker processes for the fuzzy join when
+            rapidfuzz is not installed; lexemes are matched in this
+            process when 1
+    """
     print("\nFinding supplementary matches...")
     
     # Load existing mapping
@@ -84,11 +211,8 @@ def find_supplementary_matches():
     all_bhsa = find_unmatched_bhsa()
     
     # Load unmatched Strong's entries
-    with open('strongs_to_bhsa.json') as f:
-        strongs_mapping = json.load(f)
-    
     unmatched_strongs = {
-        num: entry for num, entry in strongs_mapping.items()
+        num: entry for num, entry in iter_strongs_mapping()
         if entry['match_count'] == 0
     }
     
@@ -105,23 +229,44 @@ def find_supplementary_matches():
     # Try to match using relaxed criteria
     supplementary_matches = {}
     
-    for bhsa_key, bhsa_data in list(unmatched_bhsa.items())[:100]:  # Limit to first 100
-        best_match = None
-        best_score = 0
-        
-        for strongs_num, strongs_entry in unmatched_strongs.items():
-            # Compare normalized forms
-            score = compare_hebrew(bhsa_data['normalized'], strongs_entry['strongs_normalized'])
-            
-            if score > best_score and score >= 0.6:  # Lower threshold
-                best_score = score
-                best_match = {
-                    'strongs': strongs_num,
-                    'strongs_lemma': strongs_entry['strongs_lemma'],
-                    'score': round(score, 3),
-                    'kjv_glosses': strongs_entry['kjv_glosses']
-                }
-        
+    index = index_strongs_candidates(unmatched_strongs)
+    
+    bhsa_keys = list(unmatched_bhsa)
+    bhsa_norms = [normalize_hebrew(data['normalized']) for data in unmatched_bhsa.values()]
+    
+    if RAPIDFUZZ_AVAILABLE:
+        # Normalized edit distance of every lexeme × candidate pair in one
+        # native call (already spread over all cores); used only to
+        # shortlist pairs for compare_hebrew
+        distances = process.cdist(
+            [encode_consonants(norm) for norm in bhsa_norms], index['codes'],
+            scorer=Levenshtein.normalized_distance,
+            score_cutoff=MAX_FUZZY_DISTANCE,
+            workers=-1
+        )
+        results = (
+            best_supplementary_match(
+                index, norm,
+                np.flatnonzero(distances[row] <= MAX_FUZZY_DISTANCE).tolist()
+            )
+            for row, norm in enumerate(bhsa_norms)
+        )
+    else:
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(index,),
+            ) as executor:
+                results = list(executor.map(
+                    _match_in_worker, bhsa_norms,
+                    chunksize=max(1, len(bhsa_norms) // (workers * 4))
+                ))
+        else:
+            results = (best_supplementary_match(index, norm) for norm in bhsa_norms)
+    
+    for bhsa_key, best_match in zip(bhsa_keys, results):
         if best_match:
             supplementary_matches[bhsa_key] = best_match
     
@@ -138,8 +283,7 @@ def find_supplementary_matches():
         }
     }
     
-    with open('bhsa_supplementary_mapping.json', 'w', encoding='utf-8') as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    dump_json_mapping(output, 'bhsa_supplementary_mapping.json')
     
     print(f"\n✓ Saved to bhsa_supplementary_mapping.json")
     
@@ -161,5 +305,20 @@ def find_supplementary_matches():
     return output
 
 
+# Candidate index shared by the functions below in worker processes
+_WORKER_INDEX = None
+
+
+def _init_worker(index):
+    """Keep the parent's candidate index for this worker."""
+    global _WORKER_INDEX
+    _WORKER_INDEX = index
+
+
+def _match_in_worker(bhsa_norm):
+    """Find the best supplementary match for one lexeme in a worker process."""
+    return best_supplementary_match(_WORKER_INDEX, bhsa_norm)
+
+
 if __name__ == '__main__':
     result = find_supplementary_matches()
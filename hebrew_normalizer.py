@@ -11,11 +11,17 @@ The normalization process handles:
 - Fuzzy matching with spelling variants
 """
 
-import re
 import unicodedata
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from difflib import SequenceMatcher
 
+try:
+    from rapidfuzz.distance import Levenshtein as _RapidfuzzLevenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 
 # Unicode ranges for Hebrew characters
 HEBREW_LETTERS = range(0x05D0, 0x05EB)  # א-ת
@@ -27,6 +33,9 @@ HEBREW_POINTS_EXTENDED = [
     [0x05C7],               # Qamats qatan
 ]
 
+# All niqqud code points, folded once at import
+_NIQQUD = frozenset(cp for point_range in HEBREW_POINTS_EXTENDED for cp in point_range)
+
 # Final form mappings
 FINAL_FORMS = {
     'ך': 'כ',  # Final Kaf -> Kaf
@@ -36,6 +45,33 @@ FINAL_FORMS = {
     'ץ': 'צ',  # Final Tsadi -> Tsadi
 }
 
+
+class _NormalizeTable(dict):
+    """
+    str.translate table for normalize_hebrew.
+    
+    Hebrew letters map to themselves (final forms to their regular form)
+    and niqqud is deleted up front; any other code point is deleted, and
+    recorded on first sight so later lookups stay in C.
+    """
+    
+    def __missing__(self, code_point):
+        self[code_point] = None
+        return None
+
+
+_NORMALIZE_TABLE = _NormalizeTable((cp, cp) for cp in HEBREW_LETTERS)
+_NORMALIZE_TABLE.update((ord(final), ord(regular)) for final, regular in FINAL_FORMS.items())
+_NORMALIZE_TABLE.update((cp, None) for cp in _NIQQUD)
+
+# Character sets for get_hebrew_stats: letters, final forms, and every
+# nonspacing mark (Unicode category Mn) in the Hebrew block
+_LETTER_CHARS = frozenset(map(chr, HEBREW_LETTERS))
+_FINAL_CHARS = frozenset(FINAL_FORMS)
+_HEBREW_MARK_CHARS = frozenset(
+    chr(cp) for cp in range(0x0590, 0x0600) if unicodedata.category(chr(cp)) == 'Mn'
+)
+
 # Common spelling variants (plene vs. defective)
 SPELLING_VARIANTS = {
     'ו': '',   # Vav as mater lectionis
@@ -43,6 +79,7 @@ SPELLING_VARIANTS = {
 }
 
 
+@lru_cache(maxsize=200_000)
 def normalize_hebrew(text: str) -> str:
     """
     Normalize Hebrew text to consonantal skeleton.
@@ -70,28 +107,31 @@ def normalize_hebrew(text: str) -> str:
     if not text:
         return ''
     
-    # Remove combining characters (niqqud, dagesh, etc.)
-    normalized = ''
-    for char in text:
-        # Skip combining characters (vowel points, dagesh, etc.)
-        if unicodedata.category(char) == 'Mn':  # Mark, nonspacing
-            continue
-        # Skip specific Hebrew point ranges
-        code_point = ord(char)
-        if any(code_point in point_range for point_range in HEBREW_POINTS_EXTENDED):
-            continue
-        if code_point == 0x05C7:  # Qamats qatan
-            continue
-        normalized += char
-    
-    # Normalize final forms
-    for final, regular in FINAL_FORMS.items():
-        normalized = normalized.replace(final, regular)
+    # A single translate pass drops niqqud, dagesh and every other
+    # non-letter, and maps final forms to regular forms
+    return text.translate(_NORMALIZE_TABLE)
+
+
+# The 22 consonants left by normalize_hebrew, numbered 0-21
+CONSONANTS = ''.join(chr(cp) for cp in HEBREW_LETTERS if chr(cp) not in FINAL_FORMS)
+_CONSONANT_CODES = {ord(char): code for code, char in enumerate(CONSONANTS)}
+
+
+def encode_consonants(text: str) -> bytes:
+    """
+    Encode normalized Hebrew text as one byte per consonant (0-21).
     
-    # Strip whitespace and other non-Hebrew characters (keep only Hebrew letters)
-    result = ''.join(char for char in normalized if 0x05D0 <= ord(char) <= 0x05EA)
+    Distinct consonants get distinct bytes, so edit distances between
+    encoded forms equal those between the texts, while comparisons and
+    storage work on single bytes instead of 2-byte code points.
     
-    return result
+    Args:
+        text: Output of normalize_hebrew
+        
+    Returns:
+        Byte string of consonant indexes
+    """
+    return text.translate(_CONSONANT_CODES).encode('latin-1')
 
 
 def remove_matres_lectionis(text: str) -> str:
@@ -113,11 +153,8 @@ def remove_matres_lectionis(text: str) -> str:
     """
     # This is a simplified approach - true mater lectionis detection
     # requires morphological analysis
-    result = text
     # Remove doubled vav/yod which are likely vowel indicators
-    result = re.sub(r'וו', 'ו', result)
-    result = re.sub(r'יי', 'י', result)
-    return result
+    return text.replace('וו', 'ו').replace('יי', 'י')
 
 
 def levenshtein_distance(s1: str, s2: str) -> int:
@@ -130,31 +167,58 @@ def levenshtein_distance(s1: str, s2: str) -> int:
         
     Returns:
         Edit distance (number of single-character edits needed)
+        
+    Note:
+        Uses rapidfuzz's C++ implementation when it is installed, and
+        Myers' bit-parallel algorithm in pure Python otherwise.
     """
+    if RAPIDFUZZ_AVAILABLE:
+        return _RapidfuzzLevenshtein.distance(s1, s2)
+    
+    # Keep the shorter string as the pattern packed into the bit vectors
     if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
+        s1, s2 = s2, s1
     
     if len(s2) == 0:
         return len(s1)
     
-    previous_row = range(len(s2) + 1)
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            # Cost of insertions, deletions, or substitutions
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
-    
-    return previous_row[-1]
+    # Bit i of peq[c] is set where the pattern has c at position i
+    peq = {}
+    bit = 1
+    for c in s2:
+        peq[c] = peq.get(c, 0) | bit
+        bit <<= 1
+    
+    # One column of the DP matrix per character of the text, held as the
+    # vertical +1 (pv) and -1 (mv) deltas; Python ints are wide enough for
+    # any pattern length
+    mask = bit - 1
+    last = bit >> 1
+    pv = mask
+    mv = 0
+    score = len(s2)
+    for c in s1:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        pv = ((mh << 1) | ~(xv | ph)) & mask
+        mv = ph & xv
+    
+    return score
 
 
 def compare_hebrew(text1: str, text2: str, 
                    fuzzy: bool = True,
                    weight_exact: float = 1.0,
-                   weight_consonantal: float = 0.9) -> float:
+                   weight_consonantal: float = 0.9,
+                   min_score: float = 0.0) -> float:
     """
     Compare two Hebrew texts and return similarity score.
     
@@ -169,6 +233,9 @@ def compare_hebrew(text1: str, text2: str,
         fuzzy: Enable fuzzy matching for spelling variants
         weight_exact: Weight for exact matches (default 1.0)
         weight_consonantal: Weight for consonantal matches (default 0.9)
+        min_score: Lowest score the caller is interested in; lower scores
+            may be returned as 0.0, which lets fuzzy pairs that cannot reach
+            it skip the Levenshtein distance (default 0.0)
         
     Returns:
         Similarity score from 0.0 (no match) to 1.0 (exact match)
@@ -188,10 +255,56 @@ def compare_hebrew(text1: str, text2: str,
     if text1 == text2:
         return weight_exact
     
-    # Normalize both texts
-    norm1 = normalize_hebrew(text1)
-    norm2 = normalize_hebrew(text2)
+    return _compare_normalized(normalize_hebrew(text1), normalize_hebrew(text2),
+                               fuzzy, weight_consonantal, min_score)
+
+
+def compare_hebrew_normalized(norm1: str, norm2: str,
+                              fuzzy: bool = True,
+                              weight_exact: float = 1.0,
+                              weight_consonantal: float = 0.9,
+                              min_score: float = 0.0) -> float:
+    """
+    compare_hebrew for texts that are already normalize_hebrew output.
+    
+    Gives the same score as compare_hebrew on such texts, without
+    normalizing them again. Use this in loops over normalized forms.
+    """
+    if not norm1 or not norm2:
+        return 0.0
+    
+    if norm1 == norm2:
+        return weight_exact
+    
+    return _compare_normalized(norm1, norm2, fuzzy, weight_consonantal, min_score)
+
+
+def _edit_lower_bound(text1: str, text2: str) -> int:
+    """
+    Lower bound on the Levenshtein distance from the letter counts alone.
     
+    Every edit adds, removes or replaces one letter, so the distance is at
+    least the number of letters text1 has in excess, and at least the number
+    it lacks, compared to text2.
+    """
+    counts = {}
+    for char in text1:
+        counts[char] = counts.get(char, 0) + 1
+    for char in text2:
+        counts[char] = counts.get(char, 0) - 1
+    
+    excess = 0
+    for count in counts.values():
+        if count > 0:
+            excess += count
+    lacking = excess - len(text1) + len(text2)
+    return excess if excess > lacking else lacking
+
+
+def _compare_normalized(norm1: str, norm2: str, fuzzy: bool,
+                        weight_consonantal: float,
+                        min_score: float = 0.0) -> float:
+    """Score two normalized texts from the consonantal match onwards."""
     # Consonantal match
     if norm1 == norm2:
         return weight_consonantal
@@ -199,10 +312,22 @@ def compare_hebrew(text1: str, text2: str,
     if not fuzzy:
         return 0.0
     
+    # Nothing left to compare once points are stripped (e.g. pure punctuation)
+    if not norm1 or not norm2:
+        return 0.0
+    
     # Fuzzy matching with Levenshtein distance
     max_len = max(len(norm1), len(norm2))
-    if max_len == 0:
-        return 0.0
+    
+    # Skip the distance when even its lower bound cannot reach min_score,
+    # unless the pair may still be a 0.85 spelling variant below
+    if min_score > 0.0:
+        bound = abs(len(norm1) - len(norm2))
+        if 0.7 * (1.0 - bound / max_len) >= min_score:
+            bound = _edit_lower_bound(norm1, norm2)
+        if (0.7 * (1.0 - bound / max_len) < min_score
+                and remove_matres_lectionis(norm1) != remove_matres_lectionis(norm2)):
+            return 0.0
     
     distance = levenshtein_distance(norm1, norm2)
     similarity = 1.0 - (distance / max_len)
@@ -221,6 +346,27 @@ def compare_hebrew(text1: str, text2: str,
     return similarity * fuzzy_weight
 
 
+@lru_cache(maxsize=1_000_000)
+def _compare_pair(text1: str, text2: str) -> float:
+    return compare_hebrew(text1, text2)
+
+
+def compare_hebrew_cached(text1: str, text2: str) -> float:
+    """
+    Memoized compare_hebrew with the default weights.
+    
+    The score is symmetric, so the pair is cached in a canonical order.
+    Use this in loops that compare the same forms many times.
+    """
+    if text2 < text1:
+        text1, text2 = text2, text1
+    return _compare_pair(text1, text2)
+
+
+# Fields that may hold the Hebrew text of a Strong's entry, in order of preference
+STRONGS_HEBREW_FIELDS = ('lemma', 'hebrew', 'word', 'text')
+
+
 def extract_strongs_hebrew(strongs_entry: Dict[str, Any], 
                            field: str = 'lemma') -> str:
     """
@@ -249,7 +395,7 @@ def extract_strongs_hebrew(strongs_entry: Dict[str, Any],
     
     # Fallback to other possible field names
     if not hebrew_text:
-        for alt_field in ['lemma', 'hebrew', 'word', 'text']:
+        for alt_field in STRONGS_HEBREW_FIELDS:
             hebrew_text = strongs_entry.get(alt_field, '')
             if hebrew_text:
                 break
@@ -342,22 +488,25 @@ def get_hebrew_stats(text: str) -> Dict[str, Any]:
         'length': len(text)
     }
     
+    consonants = final_forms = vowel_points = 0
     for char in text:
-        code_point = ord(char)
-        
         # Check for Hebrew consonants
-        if 0x05D0 <= code_point <= 0x05EA:
-            stats['consonants'] += 1
+        if char in _LETTER_CHARS:
+            consonants += 1
             
             # Check for final forms
-            if char in FINAL_FORMS:
-                stats['final_forms'] += 1
+            if char in _FINAL_CHARS:
+                final_forms += 1
         
-        # Check for vowel points
-        if unicodedata.category(char) == 'Mn':
-            stats['vowel_points'] += 1
-            stats['has_niqqud'] = True
-    
+        # Check for vowel points (marks outside the Hebrew block are rare)
+        elif char in _HEBREW_MARK_CHARS or (
+                not '\u0590' <= char <= '\u05ff' and unicodedata.category(char) == 'Mn'):
+            vowel_points += 1
+    
+    stats['consonants'] = consonants
+    stats['final_forms'] = final_forms
+    stats['vowel_points'] = vowel_points
+    stats['has_niqqud'] = vowel_points > 0
     return stats
 
 
@@ -372,7 +521,14 @@ def normalize_hebrew_list(texts: list[str]) -> list[str]:
     Returns:
         List of normalized texts
     """
-    return [normalize_hebrew(text) for text in texts]
+    # Translate each distinct text once (lexeme lists repeat heavily), then
+    # fan the results back out in input order
+    table = _NORMALIZE_TABLE
+    normalized = {
+        text: text.translate(table) if text else ''
+        for text in dict.fromkeys(texts)
+    }
+    return [normalized[text] for text in texts]
 
 
 if __name__ == '__main__':
@@ -0,0 +1,83 @@
+"""
+Tests for the Strong's candidate search in create_complete_bhsa_mapping
+
+Run with: pytest test_complete_mapping.py -v
+"""
+
+import random
+
+import pytest
+from create_complete_bhsa_mapping import (
+    FUZZY_RADIUS,
+    build_strongs_finder,
+    deletion_variants,
+)
+from hebrew_normalizer import compare_hebrew, levenshtein_distance
+
+
+def full_scan(bhsa_norm, strongs_norms):
+    """Score every Strong's form in mapping order, keeping the first best."""
+    best_i = None
+    best_score = 0
+    for i, norm in enumerate(strongs_norms):
+        score = compare_hebrew(bhsa_norm, norm)
+        if score > best_score:
+            best_i = i
+            best_score = score
+    return best_i, best_score
+
+
+class TestDeletionVariants:
+    """Test cases for deletion_variants."""
+    
+    def test_variants(self):
+        """Test the strings left after up to depth deletions."""
+        assert deletion_variants('אב', 1) == {'אב', 'א', 'ב'}
+        assert deletion_variants('אב', 2) == {'אב', 'א', 'ב', ''}
+    
+    def test_near_forms_share_a_variant(self):
+        """Test that forms within FUZZY_RADIUS always share a variant."""
+        rng = random.Random(0)
+        letters = 'אבהוי'
+        for _ in range(2000):
+            word1 = ''.join(rng.choice(letters) for _ in range(rng.randint(0, 6)))
+            word2 = ''.join(rng.choice(letters) for _ in range(rng.randint(0, 6)))
+            if levenshtein_distance(word1, word2) <= FUZZY_RADIUS:
+                assert deletion_variants(word1, FUZZY_RADIUS) & \
+                    deletion_variants(word2, FUZZY_RADIUS)
+
+
+class TestBuildStrongsFinder:
+    """Test cases for build_strongs_finder."""
+    
+    def test_tie_outside_radius(self):
+        """Test that a tie at the radius bound goes to the earlier entry."""
+        # 'הבבא' is 2 edits away and found through the deletion index;
+        # 'האאבבב' is 3 edits away, outside it, and also scores 0.35
+        strongs_norms = ('האאבבב', 'הבבא')
+        find_best_strongs = build_strongs_finder(strongs_norms)
+        assert find_best_strongs('האא') == full_scan('האא', strongs_norms)
+        assert find_best_strongs('האא')[0] == 0
+    
+    def test_matches_full_scan(self):
+        """Test that the indexed search agrees with a full scan on short forms."""
+        rng = random.Random(0)
+        letters = 'אבהוי'
+        for _ in range(100):
+            strongs_norms = tuple(
+                ''.join(rng.choice(letters) for _ in range(rng.randint(0, 6)))
+                for _ in range(60)
+            )
+            find_best_strongs = build_strongs_finder(strongs_norms)
+            for _ in range(20):
+                bhsa_norm = ''.join(rng.choice(letters) for _ in range(rng.randint(1, 6)))
+                assert find_best_strongs(bhsa_norm) == full_scan(bhsa_norm, strongs_norms)
+    
+    def test_empty_form(self):
+        """Test that an empty form has no match."""
+        find_best_strongs = build_strongs_finder(('אב',))
+        assert find_best_strongs('') == (None, 0)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
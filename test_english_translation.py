@@ -3,9 +3,13 @@
 Test script for English translation integration.
 
 This script tests the English translation functionality by:
-1. Loading the BHSA corpus
-2. Running a simple query
-3. Displaying results with English translations
+1. Checking the English translation provider on its own
+2. Loading the BHSA corpus
+3. Running a simple query
+4. Displaying results with English translations
+
+The provider check does not need the corpus, so it can be run alone with:
+pytest test_english_translation.py::test_english_provider_only
 """
 
 import sys
@@ -14,19 +18,9 @@ import os
 # Add the tf module to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'tf'))
 
-from tf.app import use
 
-def test_english_translation():
-    """Test English translation display."""
-    
-    print("Loading BHSA corpus...")
-    A = use('etcbc/bhsa', checkout="clone")
-    
-    if not A:
-        print("Failed to load BHSA corpus")
-        return False
-    
-    print("? Corpus loaded successfully\n")
+def test_english_provider_only():
+    """Test the English translation provider without loading the corpus."""
     
     # Test the English translation module directly
     print("Testing English translation module...")
@@ -58,6 +52,26 @@ def test_english_translation():
     else:
         print(f"? No translation found for node {test_node}\n")
     
+    return True
+
+
+def test_query_with_translations():
+    """Test English translation display in query results."""
+    
+    from tf.app import use
+    from tf.advanced.english import get_english_provider
+    
+    english = get_english_provider()
+    
+    print("Loading BHSA corpus...")
+    A = use('etcbc/bhsa', checkout="clone")
+    
+    if not A:
+        print("Failed to load BHSA corpus")
+        return False
+    
+    print("? Corpus loaded successfully\n")
+    
     # Run a simple query
     print("Running test query: 'word sp=verb' (first 3 results)...")
     query = "word sp=verb"
@@ -118,7 +132,7 @@ if __name__ == '__main__':
     print("=" * 60)
     print()
     
-    success = test_english_translation()
+    success = test_english_provider_only() and test_query_with_translations()
     
     print()
     print("=" * 60)
@@ -13,6 +13,7 @@ from hebrew_normalizer import (
     get_hebrew_stats,
     levenshtein_distance,
     remove_matres_lectionis,
+    encode_consonants,
 )
 
 
@@ -246,6 +247,26 @@ class TestRemoveMatresLectionis:
         assert remove_matres_lectionis('מלכ') == 'מלכ'
 
 
+class TestEncodeConsonants:
+    """Test cases for encode_consonants function."""
+    
+    def test_one_byte_per_consonant(self):
+        """Test that each consonant becomes one byte in 0-21."""
+        assert encode_consonants('אבת') == bytes([0, 1, 21])
+        assert encode_consonants(normalize_hebrew('מֶלֶךְ')) == bytes([12, 11, 10])
+    
+    def test_empty_string(self):
+        """Test encoding of empty string."""
+        assert encode_consonants('') == b''
+    
+    def test_preserves_distance(self):
+        """Test that edit distance is unchanged by encoding."""
+        pairs = [('אהב', 'אהד'), ('דוד', 'דויד'), ('אהב', 'שנא')]
+        for a, b in pairs:
+            assert levenshtein_distance(encode_consonants(a), encode_consonants(b)) == \
+                levenshtein_distance(a, b)
+
+
 class TestEdgeCases:
     """Test edge cases and error handling."""
     
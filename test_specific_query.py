@@ -7,7 +7,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from tf.browser.ai_query import search_lexemes, extract_keywords
+from tf.browser.ai_query import search_lexemes_batch, extract_keywords
 
 # Test the query that failed
 user_query = "find all mentions of the verb to create followed by the direct object marker"
@@ -21,8 +21,9 @@ print(f"\nExtracted keywords: {keywords}")
 
 # Search for lexemes
 print("\nSearching for lexemes:")
+found = search_lexemes_batch(keywords, max_results=3)
 for keyword in keywords:
-    results = search_lexemes(keyword, max_results=3)
+    results = found[keyword]
     if results:
         print(f"\n  '{keyword}':")
         for r in results:
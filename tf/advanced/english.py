@@ -10,9 +10,30 @@ translations alongside Hebrew text in query results and passage displays.
 
 import json
 import os
-from functools import lru_cache
+import pickle
+from array import array
+from bisect import bisect_right
+from itertools import chain
+from threading import Lock
 from .english_config import get_translation_paths
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Parsed offset maps by (path, mtime), shared by all providers
+_OFFSET_CACHE = {}
+
+
+TABLE_CACHE_EXT = '.table.pkl'
+"""Extension of the parsed translation table stored next to the translation CSV."""
+
+NO_BSB_SORT = -(1 << 63)
+"""Marks a line without a BSB sort number in the int64 sort column."""
+
 
 class EnglishTranslation:
     """Lazy-loading English translation provider for BHSA nodes.
@@ -44,8 +65,13 @@ class EnglishTranslation:
         self.csv_path = csv_path
         self.offset_path = offset_path
         self.offset_map = {}
-        self._csv_file = None
-        self._line_cache = {}
+        self._offset_keys = []
+        self._offset_values = []
+        self._glosses = None
+        self._english = None
+        self._bsb_sort = None
+        self._node_lines = None
+        self._table_lock = Lock()
         
         # Try to find data files if not specified
         if csv_path is None or offset_path is None:
@@ -58,6 +84,10 @@ class EnglishTranslation:
         # Check if CSV exists
         if self.csv_path and os.path.exists(self.csv_path):
             self.enabled = True
+        else:
+            # Answer lookups directly, without checking enabled on every call
+            self.get_translation = self._no_translation
+            self.get_verse_translation = self._no_verse_translation
     
     def _find_data_files(self):
         """Try to locate translation data files in common locations."""
@@ -68,14 +98,25 @@ class EnglishTranslation:
             self.offset_path = offset_path
     
     def _load_offsets(self):
-        """Load the offset map from JSON."""
+        """Load the offset map from JSON, parsing each file version once."""
         try:
-            with open(self.offset_path, 'r') as f:
-                offset_data = json.load(f)
-                self.offset_map = {int(k): v for k, v in offset_data.items()}
+            key = (self.offset_path, os.path.getmtime(self.offset_path))
+            offset_map = _OFFSET_CACHE.get(key)
+            if offset_map is None:
+                with open(self.offset_path, 'rb') as f:
+                    data = f.read()
+                offset_data = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+                offset_map = {int(k): v for k, v in offset_data.items()}
+                _OFFSET_CACHE[key] = offset_map
+            # A copy, so changes to one provider's map stay local
+            self.offset_map = dict(offset_map)
         except Exception as e:
             print(f"Warning: Could not load offset map: {e}")
             self.offset_map = {}
+        
+        # Breakpoints in node order, for binary search in _get_offset
+        self._offset_keys = sorted(self.offset_map)
+        self._offset_values = [self.offset_map[node] for node in self._offset_keys]
     
     def _get_offset(self, bhsa_node):
         """Get the offset for a given BHSA node.
@@ -90,41 +131,9 @@ class EnglishTranslation:
         int
             Offset to apply to node ID for CSV lookup
         """
-        offset = 0
-        for node in sorted(self.offset_map.keys()):
-            if bhsa_node >= node:
-                offset = self.offset_map[node]
-            else:
-                break
-        return offset
-    
-    @lru_cache(maxsize=1000)
-    def _get_csv_line(self, line_num):
-        """Get a specific line from the CSV file with caching.
-        
-        Parameters
-        ----------
-        line_num : int
-            Line number to retrieve (1-indexed, but accounting for header row)
-            
-        Returns
-        -------
-        str or None
-            The line content, or None if not found
-        """
-        if not self.enabled:
-            return None
-        
-        try:
-            with open(self.csv_path, 'r', encoding='utf-8') as f:
-                # Skip header row (line 0) and start counting from 1
-                for i, line in enumerate(f):
-                    if i == line_num:
-                        return line.strip()
-        except Exception:
-            return None
-        
-        return None
+        # The offset of the last breakpoint at or before bhsa_node
+        i = bisect_right(self._offset_keys, bhsa_node)
+        return self._offset_values[i - 1] if i else 0
     
     def get_translation(self, bhsa_node):
         """Get English translation for a BHSA node.
@@ -143,45 +152,188 @@ class EnglishTranslation:
             - 'bsb_sort': BSB sort order (for reordering)
             Returns None if translation not available
         """
-        if not self.enabled:
-            return None
+        if self._glosses is None:
+            self._load_table()
         
-        offset = self._get_offset(bhsa_node)
-        csv_idx = bhsa_node + offset
-        
-        line = self._get_csv_line(csv_idx)
-        if not line:
+        csv_idx = self._get_csv_idx(bhsa_node)
+        if not 0 <= csv_idx < len(self._glosses):
             return None
         
-        parts = line.split('\t')
-        if len(parts) < 3:
+        gloss = self._glosses[csv_idx]
+        if gloss is None:
             return None
         
-        gloss = parts[2] if len(parts) > 2 else ''
-        bsb_field = parts[3] if len(parts) > 3 else ''
-        
-        # Parse BSB field: format is ?1?In?
-        english_text = ''
-        bsb_sort = None
-        if bsb_field:
-            # Strip the brackets ??
-            inner = bsb_field[1:-1] if len(bsb_field) > 2 else bsb_field
-            # Split on full-width @ (?)
-            if '\uff20' in inner:
-                split_parts = inner.split('\uff20')
-                if len(split_parts) == 2:
-                    try:
-                        bsb_sort = int(split_parts[0])
-                    except ValueError:
-                        pass
-                    english_text = split_parts[1]
-        
+        bsb_sort = self._bsb_sort[csv_idx]
         return {
             'gloss': gloss,
-            'english': english_text,
-            'bsb_sort': bsb_sort
+            'english': self._english[csv_idx],
+            'bsb_sort': None if bsb_sort == NO_BSB_SORT else bsb_sort
         }
     
+    @staticmethod
+    def _no_translation(bhsa_node):
+        """get_translation of a provider without translation data."""
+        return None
+    
+    @staticmethod
+    def _no_verse_translation(word_nodes):
+        """get_verse_translation of a provider without translation data."""
+        return ""
+    
+    def _csv_signature(self):
+        """Get (mtime, size) of the CSV file, to validate the table cache."""
+        return (os.path.getmtime(self.csv_path), os.path.getsize(self.csv_path))
+    
+    def _load_table(self):
+        """Load the translation table and the node lines, once.
+        
+        Threads that ask at the same time wait for the first one to finish.
+        The glosses column is assigned last: the lookups only check that one,
+        so they never see a table that is partly set.
+        """
+        with self._table_lock:
+            if self._glosses is not None:
+                return
+            
+            (glosses, english, bsb_sort) = self._read_table()
+            self._node_lines = self._build_node_lines(len(glosses))
+            self._english = english
+            self._bsb_sort = bsb_sort
+            self._glosses = glosses
+    
+    def _read_table(self):
+        """Read the translation table, from the sidecar cache when it is fresh.
+        
+        Otherwise the CSV is parsed and the table is written to the cache;
+        when it cannot be written, the table is only kept in memory.
+        
+        Returns
+        -------
+        tuple
+            (glosses, english, bsb_sort), as made by _parse_table
+        """
+        cache_path = self.csv_path + TABLE_CACHE_EXT
+        try:
+            signature = self._csv_signature()
+        except OSError:
+            signature = None
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('signature') == signature and 'columns' in cached:
+                return cached['columns']
+        except Exception:
+            pass
+        
+        columns = self._parse_table()
+        if columns[0] and signature is not None:
+            try:
+                with open(cache_path, 'wb') as f:
+                    pickle.dump(
+                        {'signature': signature, 'columns': columns},
+                        f, protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+            except OSError:
+                pass
+        return columns
+    
+    def _build_node_lines(self, n_lines):
+        """Precompute the CSV line of every node that can have one.
+        
+        Offsets only shift nodes down, so the nodes from 0 up to the line
+        count plus the largest shift cover every line. Each stretch between
+        offset breakpoints is one shifted range, so the array is filled at C
+        speed. Nodes outside it go through _get_offset.
+        
+        Parameters
+        ----------
+        n_lines : int
+            Number of lines in the translation table
+        
+        Returns
+        -------
+        array
+            CSV line number by node, for nodes 0 up to the covered count
+        """
+        n_nodes = n_lines - min(0, min(self._offset_values, default=0))
+        bounds = [min(max(node, 0), n_nodes) for node in self._offset_keys]
+        starts = [0] + bounds
+        ends = bounds + [n_nodes]
+        shifts = [0] + self._offset_values
+        return array('q', chain.from_iterable(
+            range(start + shift, end + shift)
+            for (start, end, shift) in zip(starts, ends, shifts)
+            if start < end
+        ))
+    
+    def _get_csv_idx(self, bhsa_node):
+        """Get the CSV line number for a BHSA node."""
+        node_lines = self._node_lines
+        if 0 <= bhsa_node < len(node_lines):
+            return node_lines[bhsa_node]
+        return bhsa_node + self._get_offset(bhsa_node)
+    
+    def _parse_table(self):
+        """Parse the whole CSV into columns indexed by line number.
+        
+        The gloss column holds None for lines without a translation; the
+        BSB sort column is an int64 array with NO_BSB_SORT where a line has
+        no usable sort number. Repeated glosses and English words share a
+        single string. The parsing is inlined in one loop, as it runs for
+        every line of the file.
+        
+        Returns
+        -------
+        tuple
+            (glosses, english, bsb_sort), empty if the CSV could not be read
+        """
+        glosses = []
+        english_texts = []
+        bsb_sorts = array('q')
+        strings = {}
+        share = strings.setdefault
+        try:
+            with open(self.csv_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    # Blank lines split into a single empty part
+                    parts = line.strip().split('\t')
+                    if len(parts) < 3:
+                        glosses.append(None)
+                        english_texts.append('')
+                        bsb_sorts.append(NO_BSB_SORT)
+                        continue
+                    
+                    gloss = parts[2]
+                    
+                    # Parse BSB field: format is 〔1＠In〕
+                    english_text = ''
+                    bsb_sort = NO_BSB_SORT
+                    if len(parts) > 3 and parts[3]:
+                        bsb_field = parts[3]
+                        # Strip the brackets 〔〕
+                        inner = bsb_field[1:-1] if len(bsb_field) > 2 else bsb_field
+                        # Split on a single full-width @ (＠)
+                        sort_text, at, english = inner.partition('\uff20')
+                        if at and '\uff20' not in english:
+                            try:
+                                bsb_sort = int(sort_text)
+                            except ValueError:
+                                pass
+                            english_text = share(english, english)
+                    
+                    glosses.append(share(gloss, gloss))
+                    english_texts.append(english_text)
+                    try:
+                        bsb_sorts.append(bsb_sort)
+                    except OverflowError:
+                        # Beyond int64; no real BSB sort number is this large
+                        bsb_sorts.append(NO_BSB_SORT)
+        except Exception as e:
+            print(f"Warning: Could not load translation table: {e}")
+            return ([], [], array('q'))
+        return (glosses, english_texts, bsb_sorts)
+    
     def get_verse_translation(self, word_nodes):
         """Get English translation for a sequence of words.
         
@@ -197,34 +349,51 @@ class EnglishTranslation:
         str
             English translation with words in BSB order
         """
-        if not self.enabled:
-            return ""
+        if self._glosses is None:
+            self._load_table()
         
-        words_with_sort = []
+        english = self._english
+        bsb_sorts = self._bsb_sort
+        n_lines = len(english)
+        node_lines = self._node_lines
+        n_nodes = len(node_lines)
+        get_offset = self._get_offset
+        sort_keys = []
+        texts = []
         
         for node in word_nodes:
-            trans = self.get_translation(node)
-            if trans and trans['english']:
-                text = trans['english']
-                bsb_sort = trans['bsb_sort']
+            if 0 <= node < n_nodes:
+                csv_idx = node_lines[node]
+            else:
+                csv_idx = node + get_offset(node)
+            if 0 <= csv_idx < n_lines and english[csv_idx]:
+                bsb_sort = bsb_sorts[csv_idx]
                 
                 # Use BSB sort order if available, otherwise use node order
-                sort_key = bsb_sort if bsb_sort is not None else node
-                words_with_sort.append((sort_key, text))
+                sort_keys.append(bsb_sort if bsb_sort != NO_BSB_SORT else node)
+                texts.append(english[csv_idx])
         
-        # Sort by the sort key (BSB order)
-        words_with_sort.sort(key=lambda x: x[0])
+        # Sort by the sort key (BSB order); the sort is stable, so equal
+        # keys keep node order
+        order = sorted(range(len(sort_keys)), key=sort_keys.__getitem__)
         
         # Return just the text in sorted order
-        return ' '.join([text for _, text in words_with_sort])
+        return ' '.join([texts[i] for i in order])
 
 
-# Global instance
-_english_translation = None
+# Providers by (csv_path, offset_path), created once under the lock; each
+# provider loads its table under its own lock
+_PROVIDERS = {}
+_PROVIDERS_LOCK = Lock()
 
 
 def get_english_provider(csv_path=None, offset_path=None):
-    """Get or create the global English translation provider.
+    """Get or create the shared English translation provider for these paths.
+    
+    The provider is created at most once per pair of paths, also when
+    several threads ask for it at the same time. Its translation table is
+    loaded on the first lookup, under the provider's own lock, so it is
+    also parsed only once.
     
     Parameters
     ----------
@@ -238,9 +407,14 @@ def get_english_provider(csv_path=None, offset_path=None):
     EnglishTranslation
         The translation provider instance
     """
-    global _english_translation
+    key = (csv_path, offset_path)
+    provider = _PROVIDERS.get(key)
     
-    if _english_translation is None:
-        _english_translation = EnglishTranslation(csv_path, offset_path)
+    if provider is None:
+        with _PROVIDERS_LOCK:
+            provider = _PROVIDERS.get(key)
+            if provider is None:
+                provider = EnglishTranslation(csv_path, offset_path)
+                _PROVIDERS[key] = provider
     
-    return _english_translation
+    return provider
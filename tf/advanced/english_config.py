@@ -7,9 +7,11 @@ custom locations for translation data.
 """
 
 import os
+from functools import cache
 from pathlib import Path
 
 
+@cache
 def get_translation_paths():
     """Get paths to translation data files from environment or defaults.
     
@@ -19,6 +21,9 @@ def get_translation_paths():
     3. English-lineup/ directory relative to text-fabric package
     4. User's home directory ~/code/text-fabric/English-lineup/
     
+    The result is looked up once and then cached;
+    `set_translation_paths` clears the cache.
+    
     Returns
     -------
     tuple
@@ -61,3 +66,4 @@ def set_translation_paths(csv_path, offset_path):
     """
     os.environ['TF_ENGLISH_CSV'] = csv_path
     os.environ['TF_ENGLISH_OFFSET'] = offset_path
+    get_translation_paths.cache_clear()
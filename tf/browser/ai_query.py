@@ -51,24 +51,48 @@ def search_lexemes(term: str, max_results: int = 10) -> List[Dict[str, str]]:
     Returns:
         List of matching lexemes with lex, sp, gloss, and voc_lex
     """
-    df = load_lexemes()
-    term_lower = term.lower().strip()
+    return search_lexemes_batch([term], max_results=max_results)[term]
+
+
+def search_lexemes_batch(terms: List[str], max_results: int = 10) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Search for lexemes for several terms at once.
     
-    # Search in gloss column (case-insensitive)
-    matches = df[df['gloss'].str.lower().str.contains(term_lower, na=False, regex=False)]
+    The glosses are lowercased once for all terms instead of once per term.
     
-    # Limit results
-    matches = matches.head(max_results)
+    Args:
+        terms: Search terms (English words or Hebrew)
+        max_results: Maximum number of results to return per term
+        
+    Returns:
+        Dict from each term to its list of matching lexemes, as returned
+        by search_lexemes
+    """
+    df = load_lexemes()
+    glosses = df['gloss'].str.lower()
     
-    # Convert to list of dicts
-    results = []
-    for _, row in matches.iterrows():
-        results.append({
-            'lex': str(row['lex']),
-            'sp': str(row['sp']),
-            'gloss': str(row['gloss']),
-            'voc_lex': str(row['voc_lex']) if pd.notna(row['voc_lex']) else ''
-        })
+    results = {}
+    for term in terms:
+        if term in results:
+            continue
+        term_lower = term.lower().strip()
+        
+        # Search in gloss column (case-insensitive)
+        matches = df[glosses.str.contains(term_lower, na=False, regex=False)]
+        
+        # Limit results
+        matches = matches.head(max_results)
+        
+        # Convert to list of dicts
+        results[term] = [
+            {
+                'lex': str(row['lex']),
+                'sp': str(row['sp']),
+                'gloss': str(row['gloss']),
+                'voc_lex': str(row['voc_lex']) if pd.notna(row['voc_lex']) else ''
+            }
+            for _, row in matches.iterrows()
+        ]
     
     return results
 
@@ -274,10 +298,10 @@ def generate_query(user_prompt: str, api_key: str) -> Dict[str, any]:
         
         # Extract keywords and search for lexemes
         keywords = extract_keywords(user_prompt)
+        found = search_lexemes_batch(keywords, max_results=5)
         all_lexemes = []
         for keyword in keywords:
-            lexemes = search_lexemes(keyword, max_results=5)
-            all_lexemes.extend(lexemes)
+            all_lexemes.extend(found[keyword])
         
         # Remove duplicates
         seen = set()